@@ -6,9 +6,13 @@ Streamlit Share should run: `multi_agent_app.py` directly.
 This file provides CLI utilities and startup validation.
 """
 
+import importlib
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent
@@ -21,82 +25,127 @@ setup_logging()
 import logging
 logger = logging.getLogger(__name__)
 
+# Heavy modules the app needs, in dependency order (SDKs before app code)
+CRITICAL_MODULES = (
+    "streamlit",
+    "httpx",
+    "openai",
+    "agents",
+    "multi_agents.coordinator",
+    "archive.agent_v1",
+)
 
-def startup_checks() -> bool:
-    """
-    Run startup checks before launching app.
-    
-    Returns:
-        True if all checks pass, False otherwise
-    """
-    logger.info("=" * 60)
-    logger.info("🚀 Fast Food Nutrition Agent - Startup Checks")
-    logger.info("=" * 60)
-    
-    checks_passed = True
-    
-    # Check 1: Environment variables
-    logger.info("Checking environment configuration...")
-    required_vars = ["OPENAI_API_KEY"]
-    for var in required_vars:
-        if not os.getenv(var):
-            logger.error(f"❌ Missing required environment variable: {var}")
-            checks_passed = False
-        else:
-            logger.info(f"✅ {var} configured")
-    
-    # Check 2: Database connectivity (optional)
-    logger.info("Checking database connectivity...")
+
+_BANNER = "=" * 60
+
+# A check's outcome: whether it passed, plus (log level, message) lines to report
+CheckResult = Tuple[bool, List[Tuple[int, str]]]
+
+
+def _check_database() -> CheckResult:
+    """Check database connectivity (optional - JSON storage is the fallback)."""
+    lines = [(logging.INFO, "Checking database connectivity...")]
     try:
         from config.database import is_database_available, db_config
         if is_database_available():
             if db_config.health_check():
-                logger.info("✅ Database connection healthy")
+                lines.append((logging.INFO, "✅ Database connection healthy"))
             else:
-                logger.warning("⚠️ Database connection degraded (fallback to JSON)")
+                lines.append((logging.WARNING, "⚠️ Database connection degraded (fallback to JSON)"))
         else:
-            logger.info("ℹ️  Database not configured (using JSON storage)")
+            lines.append((logging.INFO, "ℹ️  Database not configured (using JSON storage)"))
     except Exception as e:
-        logger.warning(f"⚠️ Database check failed: {e} (fallback to JSON)")
-    
-    # Check 3: Required directories
-    logger.info("Checking required directories...")
-    required_dirs = ["data/profiles", "logs"]
-    for dir_path in required_dirs:
-        path = Path(dir_path)
-        if not path.exists():
-            logger.info(f"Creating directory: {dir_path}")
-            path.mkdir(parents=True, exist_ok=True)
-        logger.info(f"✅ {dir_path} exists")
-    
-    # Check 4: Import critical modules
-    logger.info("Checking critical modules...")
+        lines.append((logging.WARNING, f"⚠️ Database check failed: {e} (fallback to JSON)"))
+    return True, lines
+
+
+def _check_imports() -> CheckResult:
+    """Import critical modules, timing each to surface slow imports."""
+    lines = [(logging.INFO, "Checking critical modules...")]
     try:
-        import streamlit
-        import openai
-        from multi_agents.coordinator import run_multi_agent_workflow
-        logger.info("✅ All critical modules importable")
+        for module_name in CRITICAL_MODULES:
+            start = time.perf_counter()
+            importlib.import_module(module_name)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            lines.append((logging.INFO, f"   {module_name} imported in {elapsed_ms:.0f}ms"))
+        lines.append((logging.INFO, "✅ All critical modules importable"))
     except ImportError as e:
-        logger.error(f"❌ Failed to import critical module: {e}")
-        checks_passed = False
-    
-    # Check 5: Cost controls
-    logger.info("Checking cost controls...")
+        lines.append((logging.ERROR, f"❌ Failed to import critical module: {e}"))
+        return False, lines
+    return True, lines
+
+
+def _check_cost_controls() -> CheckResult:
+    """Check that cost controls load and report their limits."""
+    lines = [(logging.INFO, "Checking cost controls...")]
     try:
         from config.cost_control import cost_controller
         limits = cost_controller.get_usage_summary()
-        logger.info(f"✅ Daily limit: ${limits['daily_limit']:.2f}")
-        logger.info(f"✅ Monthly limit: ${limits['monthly_limit']:.2f}")
+        lines.append((logging.INFO, f"✅ Daily limit: ${limits['daily_limit']:.2f}"))
+        lines.append((logging.INFO, f"✅ Monthly limit: ${limits['monthly_limit']:.2f}"))
     except Exception as e:
-        logger.error(f"❌ Cost controls check failed: {e}")
-        checks_passed = False
+        lines.append((logging.ERROR, f"❌ Cost controls check failed: {e}"))
+        return False, lines
+    return True, lines
+
+
+# I/O-bound checks that are independent of each other and run concurrently
+CONCURRENT_CHECKS = (_check_database, _check_imports, _check_cost_controls)
+
+
+def startup_checks() -> bool:
+    """
+    Run startup checks before launching app.
     
-    logger.info("=" * 60)
+    The database, import and cost-control checks run in a thread pool, so
+    startup waits for the slowest of them rather than their sum. The whole
+    report is logged as a single multi-line record once all checks finish.
+    
+    Returns:
+        True if all checks pass, False otherwise
+    """
+    lines = [_BANNER, "🚀 Fast Food Nutrition Agent - Startup Checks", _BANNER]
+    level = logging.INFO
+    checks_passed = True
+    
+    with ThreadPoolExecutor(max_workers=len(CONCURRENT_CHECKS)) as executor:
+        futures = [executor.submit(check) for check in CONCURRENT_CHECKS]
+        
+        # Check 1: Environment variables
+        lines.append("Checking environment configuration...")
+        required_vars = ["OPENAI_API_KEY"]
+        for var in required_vars:
+            if not os.getenv(var):
+                lines.append(f"❌ Missing required environment variable: {var}")
+                level = logging.ERROR
+                checks_passed = False
+            else:
+                lines.append(f"✅ {var} configured")
+        
+        # Check 2: Required directories (kept serial - filesystem side effects)
+        lines.append("Checking required directories...")
+        required_dirs = ["data/profiles", "logs"]
+        for dir_path in required_dirs:
+            Path(dir_path).mkdir(parents=True, exist_ok=True)
+            lines.append(f"✅ {dir_path} ready")
+        
+        # Checks 3-5: Database, critical modules, cost controls
+        for future in futures:
+            passed, check_lines = future.result()
+            for line_level, message in check_lines:
+                lines.append(message)
+                level = max(level, line_level)
+            checks_passed = checks_passed and passed
+    
+    lines.append(_BANNER)
     if checks_passed:
-        logger.info("✅ All startup checks passed")
+        lines.append("✅ All startup checks passed")
     else:
-        logger.error("❌ Some startup checks failed")
-    logger.info("=" * 60)
+        lines.append("❌ Some startup checks failed")
+    lines.append(_BANNER)
+    
+    # One record for the whole report, at the most severe level seen
+    logger.log(level, "\n".join(lines))
     
     return checks_passed
 
@@ -114,15 +163,15 @@ def main():
     
     # Note: When deployed to Streamlit Share, this file should not be used.
     # Streamlit Share should run multi_agent_app.py directly.
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("✅ Startup checks complete!")
-    print("=" * 60)
+    print(_BANNER)
     print("\nTo run the application:")
     print("  streamlit run multi_agent_app.py")
     print("\nFor Streamlit Share deployment:")
     print("  Main file: multi_agent_app.py")
-    print("=" * 60)
+    print(_BANNER)
 
 
 if __name__ == "__main__":
-    main
+    main()
@@ -0,0 +1,6 @@
+"""
+Legacy single-agent implementation (version 1).
+
+agent_v1 is the only single-agent implementation and backs the
+coordinator's fallback mode; app_v1 is kept for reference.
+"""
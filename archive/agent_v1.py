@@ -8,11 +8,70 @@ preferences.
 
 import os
 import asyncio
-from typing import Dict, List, Optional
+from functools import lru_cache
+from string import Template
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 from agents import Agent, Runner, set_default_openai_key
 
-from memory.user_profile import get_todays_meals, get_recent_meals
+from core.async_runner import new_event_loop
+from core.response_cache import response_cache
+from memory.user_profile import (
+    get_preference_csvs,
+    get_recent_meals,
+    get_todays_totals,
+)
+
+# Maximum number of nutrition requests sent to the API at the same time
+MAX_CONCURRENT_REQUESTS = 3
+
+# Path to the nutritionist system prompt
+PROMPT_PATH = "prompts/agent_prompt.txt"
+
+# Separates the structured goal from free-text notes (see ui.sidebar.format_user_goal)
+_NOTES_MARKER = " Additional preferences: "
+
+# Star strings for 0-5 ratings; index 0 covers unrated meals
+_RATING_STARS = ("Not rated", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+# USER CONTEXT layout; each slot is empty or starts with its own newline(s)
+_CONTEXT_TEMPLATE = Template(
+    "## USER CONTEXT"
+    "$restrictions_line$dislikes_line$methods_line$favorites_line"
+    "$stats_block$recent_meals_block$todays_line"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_base_prompt() -> str:
+    """Read the nutritionist prompt from disk once and reuse it afterwards."""
+    with open(PROMPT_PATH, "r") as file:
+        return file.read()
+
+
+async def stream_tasks(task_generator: Agent, goal: str) -> AsyncIterator[str]:
+    """
+    Stream meal recommendations from the nutrition agent as they are generated.
+
+    Args:
+        task_generator: The configured nutrition agent
+        goal: User's meal request with restaurant, calories, and dietary restrictions
+
+    Yields:
+        Text chunks of the agent's response in generation order
+    """
+    result = Runner.run_streamed(task_generator, goal)
+    try:
+        async for event in result.stream_events():
+            if (
+                event.type == "raw_response_event"
+                and getattr(event.data, "type", None) == "response.output_text.delta"
+            ):
+                yield event.data.delta
+    finally:
+        # Closed early by the consumer: stop the run so it stops generating tokens
+        if not result.is_complete:
+            result.cancel()
 
 
 async def generate_tasks(task_generator: Agent, goal: str) -> str:
@@ -26,8 +85,7 @@ async def generate_tasks(task_generator: Agent, goal: str) -> str:
     Returns:
         The agent's meal recommendation response
     """
-    result = await Runner.run(task_generator, goal)
-    return result.final_output
+    return "".join([chunk async for chunk in stream_tasks(task_generator, goal)])
 
 
 async def run_nutrition_agent(
@@ -44,112 +102,223 @@ async def run_nutrition_agent(
     Returns:
         The agent's meal recommendation response
     """
-    # Build context-aware goal if profile exists
-    if user_profile:
-        # Read the base prompt
-        with open("prompts/agent_prompt.txt", "r") as file:
-            base_prompt = file.read()
+    # The agent instructions stay byte-identical across calls so the provider can
+    # reuse its cached prompt prefix; per-user context travels in the user message.
+    context = build_user_context(user_profile) if user_profile else ""
+    request = _format_request(context, user_goal)
+
+    # Restaurant, calories and restrictions must match exactly for a cache hit;
+    # only differently worded notes are matched by similarity
+    goal, notes = _split_goal(user_goal)
+    return await response_cache.get_or_compute(
+        goal,
+        lambda: generate_tasks(task_generator, request),
+        namespace=_cache_namespace(task_generator, context),
+        notes=notes,
+    )
 
-        # Enhance with context
-        contextual_prompt = build_context_prompt(base_prompt, user_profile, user_goal)
 
-        # Create new agent with context
-        contextual_agent = Agent(
-            name="Nutrition Agent", instructions=f'"""{contextual_prompt}"""'
-        )
+async def run_nutrition_agent_stream(
+    task_generator: Agent,
+    user_goal: str,
+    user_profile: Optional[Dict] = None,
+    use_cache: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Process a single nutrition request, yielding the response as it streams.
 
-        # Get meal recommendations with context
-        tasks = await generate_tasks(contextual_agent, user_goal)
-    else:
-        # Get meal recommendations without context
-        tasks = await generate_tasks(task_generator, user_goal)
+    Exact repeats are replayed from the response cache in one chunk; fresh
+    responses are cached for exact lookups once the stream completes.
 
-    return tasks
+    Args:
+        task_generator: The configured nutrition agent
+        user_goal: User's specific meal request
+        user_profile: Optional user profile for context
+        use_cache: Set False to skip cached answers (the new one is still stored)
 
+    Yields:
+        Text chunks of the agent's meal recommendation response
+    """
+    context = build_user_context(user_profile) if user_profile else ""
+    namespace = _cache_namespace(task_generator, context)
+    goal, notes = _split_goal(user_goal)
 
-def build_context_prompt(
-    base_prompt: str, user_profile: Optional[Dict] = None, user_goal: str = ""
-) -> str:
+    cached = response_cache.get(goal, namespace=namespace, notes=notes) if use_cache else None
+    if cached is not None:
+        yield cached
+        return
+
+    chunks: List[str] = []
+    async for chunk in stream_tasks(task_generator, _format_request(context, user_goal)):
+        chunks.append(chunk)
+        yield chunk
+
+    response_cache.put(goal, "".join(chunks), namespace=namespace, notes=notes)
+
+
+def _split_goal(user_goal: str) -> Tuple[str, str]:
+    """Split a user goal into its structured request and free-text notes."""
+    goal, _, notes = user_goal.partition(_NOTES_MARKER)
+    return goal, notes
+
+
+def _cache_namespace(task_generator: Agent, context: str) -> str:
+    """Scope cached responses to the agent instructions and user context."""
+    return f"{task_generator.instructions}\x00{context}"
+
+
+def build_context_prompt(user_profile: Optional[Dict] = None, user_goal: str = "") -> str:
     """
-    Build a context-aware prompt incorporating user profile and history.
+    Build a context-aware request incorporating user profile and history.
+
+    The base nutritionist prompt is not included; it stays in the agent
+    instructions so the static prefix can be served from the prompt cache.
 
     Args:
-        base_prompt: The base nutritionist prompt
         user_profile: User profile dictionary with preferences and history
         user_goal: Current user request
 
     Returns:
-        Enhanced prompt with context
+        User message with profile context followed by the current request
     """
     if not user_profile:
-        return base_prompt
+        return user_goal
+
+    return _format_request(build_user_context(user_profile), user_goal)
 
-    prefs = user_profile.get("user_preferences", {})
+
+def _format_request(context: str, user_goal: str) -> str:
+    """Append the current request after the user context block, if any."""
+    if not context:
+        return user_goal
+    return f"{context}\n\n## CURRENT REQUEST\n{user_goal}"
+
+
+def build_user_context(user_profile: Dict) -> str:
+    """
+    Build the USER CONTEXT block from a profile's preferences and history.
+
+    Args:
+        user_profile: User profile dictionary with preferences and history
+
+    Returns:
+        Formatted context block, or an empty string when the profile has
+        no preferences or history to contribute
+    """
     stats = user_profile.get("stats", {})
+    csvs = get_preference_csvs(user_profile)
+    has_history = bool(user_profile.get("meal_history"))
+
+    # Brand-new profiles add nothing; keep the request identical to the bare goal
+    if not (has_history or stats.get("total_meals_tracked", 0) or any(csvs.values())):
+        return ""
 
-    # Build context section
-    context = "\n\n## USER CONTEXT\n"
+    # Fill each template slot; absent sections render as empty strings
+    stats_block = ""
+    if stats.get("total_meals_tracked", 0) > 0:
+        stats_block = (
+            f"\n\n- Total meals tracked: {stats['total_meals_tracked']}"
+            f"\n- Average meal calories: {stats.get('avg_daily_calories', 'N/A')} cal"
+            + _optional_line("Most visited restaurant", stats.get("most_visited_restaurant"))
+            + (
+                f"\n- Average meal satisfaction: {stats['avg_meal_rating']}/5 stars"
+                if stats.get("avg_meal_rating")
+                else ""
+            )
+        )
 
-    # Add preferences
-    if prefs.get("dietary_restrictions"):
-        context += (
-            f"- Known dietary restrictions: {', '.join(prefs['dietary_restrictions'])}\n"
+    recent_meals_block = ""
+    todays_line = ""
+    if has_history:
+        recent_meals = get_recent_meals(user_profile, count=5, newest_first=True)
+        recent_meals_block = "\n\n### Recent Meals (Last 5):\n" + "\n".join(
+            f"{i}. {meal.get('restaurant', 'Unknown')} - {meal.get('calories', 'N/A')} cal - "
+            f"{_rating_stars(meal.get('rating'))}"
+            for i, meal in enumerate(recent_meals, 1)
         )
 
-    if prefs.get("disliked_items"):
-        context += f"- Dislikes: {', '.join(prefs['disliked_items'])}\n"
+        meals_today, total_today = get_todays_totals(user_profile)
+        if meals_today:
+            todays_line = (
+                f"\n\n⚠️ User has already logged {meals_today} meal(s) today ({total_today} cal)"
+            )
+
+    return _CONTEXT_TEMPLATE.substitute(
+        restrictions_line=_optional_line("Known dietary restrictions", csvs["restrictions_csv"]),
+        dislikes_line=_optional_line("Dislikes", csvs["dislikes_csv"]),
+        methods_line=_optional_line("Preferred cooking methods", csvs["methods_csv"]),
+        favorites_line=_optional_line("Favorite restaurants", csvs["fav_restaurants_csv"]),
+        stats_block=stats_block,
+        recent_meals_block=recent_meals_block,
+        todays_line=todays_line,
+    )
 
-    if prefs.get("preferred_cooking_methods"):
-        context += f"- Preferred cooking methods: {', '.join(prefs['preferred_cooking_methods'])}\n"
 
-    if prefs.get("favorite_restaurants"):
-        context += f"- Favorite restaurants: {', '.join(prefs['favorite_restaurants'][:3])}\n"
+def _rating_stars(rating) -> str:
+    """Render a meal rating as stars, clamped to 0-5; unusable values are 'Not rated'."""
+    try:
+        return _RATING_STARS[max(0, min(int(rating or 0), 5))]
+    except (TypeError, ValueError):
+        return _RATING_STARS[0]
 
-    # Add statistics
-    if stats.get("total_meals_tracked", 0) > 0:
-        context += f"\n- Total meals tracked: {stats['total_meals_tracked']}\n"
-        context += f"- Average meal calories: {stats.get('avg_daily_calories', 'N/A')} cal\n"
 
-        if stats.get("most_visited_restaurant"):
-            context += f"- Most visited restaurant: {stats['most_visited_restaurant']}\n"
+def _optional_line(label: str, value: Optional[str]) -> str:
+    """Render a '- label: value' context line, or nothing when value is empty."""
+    return f"\n- {label}: {value}" if value else ""
 
-        if stats.get("avg_meal_rating"):
-            context += f"- Average meal satisfaction: {stats['avg_meal_rating']}/5 stars\n"
 
-    # Add recent meal history
-    recent_meals = get_recent_meals(user_profile, count=5)
-    if recent_meals:
-        context += "\n### Recent Meals (Last 5):\n"
-        for i, meal in enumerate(reversed(recent_meals), 1):
-            rating_stars = "⭐" * meal.get("rating", 0) if meal.get("rating") else "Not rated"
-            context += f"{i}. {meal.get('restaurant', 'Unknown')} - {meal.get('calories', 'N/A')} cal - {rating_stars}\n"
+async def batch_generate(
+    task_generator: Agent,
+    user_goals: List[str],
+    user_profile: Optional[Dict] = None,
+) -> List[str]:
+    """
+    Process a batch of nutrition requests that share one agent.
 
-    # Add today's meals
-    todays_meals = get_todays_meals(user_profile)
-    if todays_meals:
-        total_today = sum(m.get("calories", 0) for m in todays_meals)
-        context += f"\n⚠️ User has already logged {len(todays_meals)} meal(s) today ({total_today} cal)\n"
+    Requests run concurrently, at most MAX_CONCURRENT_REQUESTS at a time to
+    respect API rate limits, and share the agent's cached prompt prefix and
+    the response cache.
 
-    # Combine base prompt with context
-    enhanced_prompt = f"{base_prompt}\n{context}\n\n## CURRENT REQUEST\n{user_goal}"
+    Args:
+        task_generator: The configured nutrition agent
+        user_goals: Meal requests to process
+        user_profile: Optional user profile for context
 
-    return enhanced_prompt
+    Returns:
+        Agent responses in the same order as user_goals
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _bounded(user_goal: str) -> str:
+        async with semaphore:
+            return await run_nutrition_agent(task_generator, user_goal, user_profile)
+
+    return list(await asyncio.gather(*(_bounded(user_goal) for user_goal in user_goals)))
 
 
-def get_task_generator(prompt: str, user_profile: Optional[Dict] = None) -> Agent:
+def get_task_generator(prompt: str) -> Agent:
     """
     Create and configure the nutrition agent with the given prompt.
 
+    The agent depends only on the prompt, so it can be shared across users;
+    profile context is passed per request to run_nutrition_agent.
+
     Args:
         prompt: The system prompt containing nutritionist instructions
-        user_profile: Optional user profile for context-aware recommendations
 
     Returns:
         Configured Agent instance for nutrition recommendations
     """
+    return _build_agent(prompt)
+
+
+@lru_cache(maxsize=8)
+def _build_agent(prompt: str) -> Agent:
+    """Build the nutrition agent once per distinct prompt and reuse it."""
+    # Pass the prompt verbatim so the instructions prefix is byte-identical to the file
     return Agent(
         name="Nutrition Agent",
-        instructions=f'"""{prompt}"""',
+        instructions=prompt,
     )
 
 
@@ -160,15 +329,14 @@ async def run_nutrition_workflow() -> None:
     Sets up the environment, creates the agent, and processes a list of meal requests
     from different fast food restaurants with various dietary restrictions.
     """
-    # Load environment variables from .env file
-    load_dotenv()
+    # Load environment variables from .env file without blocking the event loop
+    await asyncio.to_thread(load_dotenv)
 
     # Set OpenAI API key explicitly for the agents library
     set_default_openai_key(os.environ["OPENAI_API_KEY"])
 
-    # Read the nutritionist prompt from file
-    with open("prompts/agent_prompt.txt", "r") as file:
-        prompt = file.read()
+    # Read the nutritionist prompt off the event loop (cached after first load)
+    prompt = await asyncio.to_thread(_load_base_prompt)
 
     # Create the nutrition agent
     task_generator = get_task_generator(prompt)
@@ -180,11 +348,11 @@ async def run_nutrition_workflow() -> None:
         "I want a 1200 calorie meal from Mcdonald's. I cannot have pork.",
     ]
 
-    # Process each meal request sequentially
-    for user_goal in user_goals:
-        await run_nutrition_agent(task_generator, user_goal)
+    # Submit all meal requests as one batch
+    await batch_generate(task_generator, user_goals)
 
 
 if __name__ == "__main__":
-    # Run the nutrition workflow
-    asyncio.run(run_nutrition_workflow())
+    # Run the nutrition workflow (on uvloop when it is installed)
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        runner.run(run_nutrition_workflow())
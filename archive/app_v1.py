@@ -11,72 +11,100 @@ based on user requirements including calorie limits, dietary restrictions,
 and restaurant preferences.
 """
 
-import asyncio
+import hashlib
+import importlib
 import os
+import threading
+import time
+from datetime import datetime
 from typing import Dict, List, Optional
 
 import streamlit as st
-from agents import set_default_openai_key
 from dotenv import load_dotenv
 
-from agent import get_task_generator, run_nutrition_agent
-from memory.user_profile import (
-    add_meal_to_history,
-    create_default_profile,
-    get_profile_summary,
-    get_recent_meals,
-    list_profiles,
-    load_profile,
-    save_profile,
-)
+from core.async_runner import iter_async
+from memory.user_profile import add_meal_to_history, get_recent_meals
+from ui.sidebar import format_user_goal, render_sidebar, save_profile_and_refresh
 
 
-def format_user_goal(
-    restaurant: str,
-    calories: int,
-    dietary_restrictions: List[str],
-    additional_notes: str,
-) -> str:
+# Seconds to wait for the agent before giving up on a request
+AGENT_TIMEOUT_SECONDS = 120
+
+# The agent module pulls in the agents and OpenAI SDKs; imported off the
+# critical path so the page renders before they finish loading
+AGENT_MODULE = "archive.agent_v1"
+
+# Re-render streamed text only after this many new characters or seconds
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL_S = 0.05
+
+
+@st.cache_resource(show_spinner=False)
+def _load_prompt(path: str = "prompts/agent_prompt.txt") -> str:
+    """Read a prompt file once per process; the string is shared, not copied, on reruns."""
+    with open(path, "r") as file:
+        return file.read()
+
+
+@st.cache_resource(show_spinner=False)
+def _configure_openai_client() -> None:
     """
-    Format user inputs into a natural language goal for the nutrition agent.
+    Install one shared AsyncOpenAI client for the agents library.
 
-    Args:
-        restaurant: The name of the restaurant where the user wants to eat.
-        calories: The target calorie count for the meal.
-        dietary_restrictions: List of dietary restrictions or preferences.
-        additional_notes: Any additional preferences or notes from the user.
+    Every agent run then reuses the same HTTP connection pool on the
+    background event loop.
+    """
+    from agents import set_default_openai_client
+    from openai import AsyncOpenAI
 
-    Returns:
-        A formatted string representing the user's meal request.
+    set_default_openai_client(AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")))
 
-    Raises:
-        ValueError: If restaurant name is empty or invalid.
+
+@st.cache_resource(show_spinner=False)
+def _get_agent(prompt: str):
+    """Build the nutrition agent once per prompt and share it across reruns."""
+    from archive.agent_v1 import get_task_generator
+
+    _configure_openai_client()
+    return get_task_generator(prompt)
+
+
+@st.cache_data(show_spinner=False)
+def _fmt_ts(timestamp: str) -> str:
+    """Format an ISO meal timestamp for display, or '' if it can't be parsed."""
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except ValueError:
+        return ""
+
+
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> bool:
     """
-    # Validate restaurant input
-    if not restaurant.strip():
-        raise ValueError("Restaurant name cannot be empty")
-
-    # Format dietary restrictions into natural language
-    if dietary_restrictions:
-        if len(dietary_restrictions) == 1:
-            restrictions_text = (
-                f"I have dietary restrictions: {dietary_restrictions[0]}"
-            )
-        else:
-            restrictions_text = (
-                f"I have dietary restrictions: {', '.join(dietary_restrictions)}"
-            )
-    else:
-        restrictions_text = "I have no dietary restrictions"
+    Load .env and start importing the agent module, once per process.
 
-    # Build the main user goal
-    user_goal = f"I want a {calories} calorie meal from {restaurant.lower()}. {restrictions_text}."
+    The import runs on a daemon thread while the user fills in the sidebar;
+    by the time they submit, the module (and the SDKs it loads) is cached.
+
+    Returns:
+        True if an OpenAI API key was found, False otherwise
+    """
+    load_dotenv()
+    if not os.getenv("OPENAI_API_KEY"):
+        return False
+    threading.Thread(
+        target=importlib.import_module,
+        args=(AGENT_MODULE,),
+        name="agent-prewarm",
+        daemon=True,
+    ).start()
+    return True
 
-    # Add additional notes if provided
-    if additional_notes.strip():
-        user_goal += f" Additional preferences: {additional_notes.strip()}."
 
-    return user_goal
+def _goal_hash(user_goal: str, profile_name: Optional[str]) -> str:
+    """Fingerprint a request; the profile is included since it changes the agent's context."""
+    key = f"{profile_name or ''}\x00{user_goal}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
 
 
 def display_previous_recommendations() -> None:
@@ -84,17 +112,19 @@ def display_previous_recommendations() -> None:
     Display previously generated recommendations from session state.
 
     Shows recommendations that were generated in previous interactions
-    and provides an option to clear them.
+    and provides an option to clear them. Skipped on the rerun that just
+    generated them, since generate_meal_recommendations already rendered them.
     """
-    if (
-        hasattr(st.session_state, "show_recommendations")
-        and st.session_state.show_recommendations
-    ):
+    just_generated = st.session_state.pop("_just_generated", False)
+    if st.session_state.get("show_recommendations") and not just_generated:
         st.markdown("---")
         st.header("🍽️ Your Previous Meal Recommendations")
         st.markdown(st.session_state.recommendations)
-        st.code(st.session_state.recommendations, language="text")
-        st.caption("💡 You can select and copy the text above")
+
+        # Only send the raw copy to the browser when the user asks for it
+        if st.checkbox("📋 Show raw text for copying", value=False):
+            st.code(st.session_state.recommendations, language="text")
+            st.caption("💡 You can select and copy the text above")
 
         if st.button("🗑️ Clear Previous Recommendations"):
             st.session_state.show_recommendations = False
@@ -103,7 +133,11 @@ def display_previous_recommendations() -> None:
 
 
 def generate_meal_recommendations(
-    user_goal: str, restaurant: str, calories: int, user_profile: Optional[Dict] = None
+    user_goal: str,
+    restaurant: str,
+    calories: int,
+    user_profile: Optional[Dict] = None,
+    force_refresh: bool = False,
 ) -> None:
     """
     Generate meal recommendations using the nutrition agent.
@@ -113,6 +147,10 @@ def generate_meal_recommendations(
         restaurant: Restaurant name for logging
         calories: Calorie count for logging
         user_profile: Optional user profile for context
+        force_refresh: Skip cached answers and ask the agent again
+
+    Resubmitting the session's previous goal re-displays the stored
+    recommendations instead of calling the agent.
 
     Raises:
         FileNotFoundError: If the agent prompt file is not found.
@@ -125,20 +163,58 @@ def generate_meal_recommendations(
         )
         st.stop()
 
+    # The same goal for the same profile was just answered; show that answer again
+    goal_hash = _goal_hash(user_goal, st.session_state.get("profile_name"))
+    if (
+        not force_refresh
+        and st.session_state.get("last_goal_hash") == goal_hash
+        and st.session_state.get("show_recommendations")
+        and st.session_state.get("recommendations")
+    ):
+        st.info("♻️ Same request as last time - showing your previous recommendations.")
+        return
+
     # Show loading spinner during processing
     with st.spinner("🤖 Analyzing your request and finding the best meal options..."):
         try:
-            # Read the nutritionist prompt from file
-            with open("prompts/agent_prompt.txt", "r") as file:
-                prompt: str = file.read()
+            # Read the nutritionist prompt (cached after the first click)
+            prompt: str = _load_prompt()
 
-            # Create the nutrition agent
-            task_generator = get_task_generator(prompt, user_profile)
+            # Waits for the prewarm import if it is still running
+            from archive.agent_v1 import run_nutrition_agent_stream
 
-            # Run the nutrition agent and get results (with context)
-            recommendations: str = asyncio.run(
-                run_nutrition_agent(task_generator, user_goal, user_profile)
-            )
+            # Reuse the nutrition agent; profile context travels with the request
+            task_generator = _get_agent(prompt)
+
+            # Stream the recommendations into the page as they are generated
+            st.markdown("---")
+            st.header("🍽️ Your Personalized Meal Recommendations")
+            placeholder = st.empty()
+
+            chunks: List[str] = []
+            pending_chars = 0
+            last_flush = time.monotonic()
+            for chunk in iter_async(
+                run_nutrition_agent_stream(
+                    task_generator, user_goal, user_profile, use_cache=not force_refresh
+                ),
+                timeout=AGENT_TIMEOUT_SECONDS,
+            ):
+                chunks.append(chunk)
+                pending_chars += len(chunk)
+
+                # Batch deltas so each re-render carries a meaningful update
+                now = time.monotonic()
+                if (
+                    pending_chars >= STREAM_FLUSH_CHARS
+                    or now - last_flush >= STREAM_FLUSH_INTERVAL_S
+                ):
+                    placeholder.markdown("".join(chunks))
+                    pending_chars = 0
+                    last_flush = now
+
+            recommendations: str = "".join(chunks)
+            placeholder.markdown(recommendations)
 
             # Store recommendations in session state for persistence
             st.session_state.recommendations = recommendations
@@ -146,29 +222,12 @@ def generate_meal_recommendations(
             st.session_state.last_restaurant = restaurant
             st.session_state.last_calories = calories
             st.session_state.meal_logged = False
+            st.session_state.last_goal_hash = goal_hash
+            st.session_state._just_generated = True
 
             # Display success message
             st.success("✅ Meal recommendations generated!")
 
-            # Create a nice display for the recommendations
-            st.markdown("---")
-            st.header("🍽️ Your Personalized Meal Recommendations")
-
-            # Display the recommendations in formatted markdown
-            st.markdown(recommendations)
-
-            # Add copy functionality
-            st.markdown("---")
-
-            if st.button(
-                "📋 Copy to Clipboard",
-                help="Copy the recommendations to your clipboard",
-            ):
-                st.code(recommendations, language="text")
-                st.success(
-                    "📋 Recommendations displayed above - you can now select and copy the text!"
-                )
-
         except FileNotFoundError:
             st.error(
                 "❌ Could not find the agent prompt file. Please ensure 'prompts/agent_prompt.txt' exists."
@@ -177,22 +236,19 @@ def generate_meal_recommendations(
             st.error(f"❌ An error occurred: {str(e)}")
 
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Set OpenAI API key explicitly for the agents library
-set_default_openai_key(os.environ["OPENAI_API_KEY"])
+# Load environment variables and prewarm the agent import (once per process)
+api_key_configured = _bootstrap()
 
 # Configure Streamlit page settings
 st.set_page_config(
     page_title="Fast Food Nutrition Agent", page_icon="🍔", layout="wide"
 )
 
-# Initialize session state for profile
-if "current_profile" not in st.session_state:
-    st.session_state.current_profile = None
-if "profile_name" not in st.session_state:
-    st.session_state.profile_name = None
+if not api_key_configured:
+    st.error(
+        "❌ OpenAI API key not found. Please set your OPENAI_API_KEY environment variable."
+    )
+    st.stop()
 
 # Title and description
 st.title("🍔 Fast Food Nutrition Agent")
@@ -200,215 +256,8 @@ st.markdown("""
 Get personalized meal recommendations from fast food restaurants based on your dietary needs and calorie requirements.
 """)
 
-# Create sidebar for user input controls
-st.sidebar.header("👤 Profile Management")
-
-# Profile selection and management
-available_profiles = list_profiles()
-
-profile_action = st.sidebar.radio(
-    "Profile Options:",
-    ["Use Existing Profile", "Create New Profile", "No Profile (Guest)"],
-)
-
-if profile_action == "Use Existing Profile":
-    if available_profiles:
-        selected_profile = st.sidebar.selectbox(
-            "Select Profile:", [""] + available_profiles
-        )
-
-        if selected_profile:
-            if (
-                st.session_state.profile_name != selected_profile
-                or st.session_state.current_profile is None
-            ):
-                st.session_state.current_profile = load_profile(selected_profile)
-                st.session_state.profile_name = selected_profile
-
-            if st.session_state.current_profile:
-                st.sidebar.success(f"✓ Loaded: {selected_profile}")
-                with st.sidebar.expander("📊 Profile Stats"):
-                    st.markdown(get_profile_summary(st.session_state.current_profile))
-    else:
-        st.sidebar.info("No profiles found. Create one below!")
-        profile_action = "Create New Profile"
-
-elif profile_action == "Create New Profile":
-    new_profile_name = st.sidebar.text_input(
-        "Profile Name:", placeholder="e.g., John, Work Diet, Keto Plan"
-    )
-
-    if st.sidebar.button("Create Profile"):
-        if new_profile_name:
-            new_profile = create_default_profile()
-            if save_profile(new_profile_name, new_profile):
-                st.session_state.current_profile = new_profile
-                st.session_state.profile_name = new_profile_name
-                st.sidebar.success(f"✓ Created profile: {new_profile_name}")
-                st.rerun()
-            else:
-                st.sidebar.error("Failed to create profile")
-        else:
-            st.sidebar.warning("Please enter a profile name")
-
-elif profile_action == "No Profile (Guest)":
-    st.session_state.current_profile = None
-    st.session_state.profile_name = None
-    st.sidebar.info("Using guest mode (no memory)")
-
-st.sidebar.markdown("---")
-st.sidebar.header("📋 Your Meal Preferences")
-
-# Restaurant selection with two options: preset list or custom input
-restaurant_option: str = st.sidebar.radio(
-    "Restaurant:", ["Select from list", "Enter custom restaurant"]
-)
-
-# Get restaurant name based on user's selection method
-restaurant: str
-default_restaurants = [
-    "Chick-fil-A",
-    "McDonald's",
-    "Subway",
-    "Taco Bell",
-    "Burger King",
-    "KFC",
-    "Pizza Hut",
-    "Domino's",
-]
-
-# Add favorite restaurants to the list if profile exists
-if st.session_state.current_profile:
-    fav_restaurants = st.session_state.current_profile["user_preferences"].get(
-        "favorite_restaurants", []
-    )
-    # Combine favorites with defaults (favorites first)
-    all_restaurants = fav_restaurants + [
-        r for r in default_restaurants if r not in fav_restaurants
-    ]
-else:
-    all_restaurants = default_restaurants
-
-if restaurant_option == "Select from list":
-    # Use predefined list of popular fast food chains
-    restaurant = st.sidebar.selectbox("Choose a restaurant:", all_restaurants)
-else:
-    # Allow user to enter any restaurant name
-    restaurant = st.sidebar.text_input(
-        "Enter restaurant name:",
-        placeholder="e.g., Five Guys, Chipotle, Panera Bread...",
-    )
-
-# Calorie target input with reasonable limits
-# Use profile default if available
-default_calories = 1200
-if st.session_state.current_profile:
-    default_calories = st.session_state.current_profile["user_preferences"].get(
-        "default_calorie_target", 1200
-    )
-
-calories: int = st.sidebar.number_input(
-    "Target calories:", min_value=300, max_value=2000, value=default_calories, step=50
-)
-
-# Dietary restrictions selection with two input methods
-restrictions_option: str = st.sidebar.radio(
-    "Dietary restrictions:", ["Select from list", "Enter custom restrictions"]
-)
-
-# Get dietary restrictions based on user's selection method
-dietary_restrictions: List[str]
-
-# Get defaults from profile if available
-default_restrictions = []
-if st.session_state.current_profile:
-    default_restrictions = st.session_state.current_profile["user_preferences"].get(
-        "dietary_restrictions", []
-    )
-
-if restrictions_option == "Select from list":
-    # Use predefined list of common dietary restrictions
-    restriction_options = [
-        "No restrictions",
-        "Gluten-free",
-        "Dairy-free",
-        "Vegetarian",
-        "Vegan",
-        "No pork",
-        "No beef",
-        "Low sodium",
-        "Low carb",
-        "Keto",
-    ]
-    
-    # Filter defaults to only include values that exist in options (case-sensitive match)
-    valid_defaults = [r for r in default_restrictions if r in restriction_options]
-    
-    dietary_restrictions = st.sidebar.multiselect(
-        "Choose restrictions (if any):",
-        restriction_options,
-        default=valid_defaults,
-    )
-else:
-    # Allow user to enter custom dietary restrictions
-    default_custom = ", ".join(default_restrictions) if default_restrictions else ""
-    custom_restrictions: str = st.sidebar.text_input(
-        "Enter your dietary restrictions:",
-        value=default_custom,
-        placeholder="e.g., no nuts, halal, kosher, diabetic-friendly...",
-    )
-    dietary_restrictions = [custom_restrictions] if custom_restrictions else []
-
-# Additional preferences and notes input
-default_notes = ""
-if st.session_state.current_profile:
-    prefs = st.session_state.current_profile["user_preferences"]
-    pref_methods = prefs.get("preferred_cooking_methods", [])
-    dislikes = prefs.get("disliked_items", [])
-
-    notes_parts = []
-    if pref_methods:
-        notes_parts.append(f"Prefer {', '.join(pref_methods)}")
-    if dislikes:
-        notes_parts.append(f"Dislike {', '.join(dislikes)}")
-    default_notes = "; ".join(notes_parts)
-
-additional_notes: str = st.sidebar.text_area(
-    "Additional preferences or notes:",
-    value=default_notes,
-    placeholder="e.g., prefer grilled over fried, need extra protein, avoid spicy foods, want to maximize fiber, etc.",
-    help="Be specific about your preferences. For example: 'I need extra protein for muscle building' or 'I prefer grilled options over fried'",
-)
-
-# Save preferences button
-if st.session_state.current_profile and st.sidebar.button(
-    "💾 Save Current Preferences to Profile"
-):
-    # Update profile with current preferences
-    st.session_state.current_profile["user_preferences"][
-        "default_calorie_target"
-    ] = calories
-    st.session_state.current_profile["user_preferences"][
-        "dietary_restrictions"
-    ] = dietary_restrictions
-
-    # Add restaurant to favorites if not already there
-    if (
-        restaurant
-        and restaurant
-        not in st.session_state.current_profile["user_preferences"][
-            "favorite_restaurants"
-        ]
-    ):
-        st.session_state.current_profile["user_preferences"][
-            "favorite_restaurants"
-        ].append(restaurant)
-
-    # Save to disk
-    if save_profile(st.session_state.profile_name, st.session_state.current_profile):
-        st.sidebar.success("✓ Preferences saved!")
-    else:
-        st.sidebar.error("Failed to save preferences")
+# Profile management and meal preferences live in the shared sidebar
+meal_request = render_sidebar()
 
 # Create main content area with two columns
 col1, col2 = st.columns([2, 1])
@@ -416,27 +265,15 @@ col1, col2 = st.columns([2, 1])
 with col1:
     st.header("🎯 Your Meal Request")
 
-    try:
-        # Format user inputs into a natural language goal
-        user_goal: str = format_user_goal(
-            restaurant, calories, dietary_restrictions, additional_notes
-        )
-
-        # Display the formatted request to the user
-        st.info(f"**Your request:** {user_goal}")
-
-    except ValueError as e:
-        # Handle validation errors (e.g., empty restaurant name)
-        st.warning(f"⚠️ {str(e)}")
-        st.stop()
-
     # Display meal history if profile exists
     if st.session_state.current_profile:
-        recent_meals = get_recent_meals(st.session_state.current_profile, count=10)
+        recent_meals = get_recent_meals(
+            st.session_state.current_profile, count=10, newest_first=True
+        )
         if recent_meals:
             with st.expander("📜 Recent Meal History (Last 10)", expanded=False):
                 st.markdown("### Your Recent Orders")
-                for i, meal in enumerate(reversed(recent_meals), 1):
+                for i, meal in enumerate(recent_meals, 1):
                     rating_display = (
                         "⭐" * meal.get("rating", 0) if meal.get("rating") else "Not rated"
                     )
@@ -444,23 +281,42 @@ with col1:
                         f"**{i}.** {meal.get('restaurant', 'Unknown')} - "
                         f"{meal.get('calories', 'N/A')} cal - {rating_display}"
                     )
-                    if meal.get("timestamp"):
-                        from datetime import datetime
-                        try:
-                            dt = datetime.fromisoformat(meal["timestamp"])
-                            st.caption(f"Date: {dt.strftime('%Y-%m-%d %H:%M')}")
-                        except ValueError:
-                            pass
-
-    # Main action button to generate meal recommendations
-    if st.button(
-        "🍽️ Get Meal Recommendations", type="primary", use_container_width=True
-    ):
-        # Reset meal_logged flag when getting new recommendations
-        st.session_state.meal_logged = False
-        generate_meal_recommendations(
-            user_goal, restaurant, calories, st.session_state.current_profile
+                    label = _fmt_ts(meal["timestamp"]) if meal.get("timestamp") else ""
+                    if label:
+                        st.caption(f"Date: {label}")
+
+    # Main action button; the request is only built when the form is submitted
+    with st.form("meal_request", border=False):
+        st.caption("Set your preferences in the sidebar, then request recommendations.")
+        force_refresh = st.checkbox(
+            "🔄 Force refresh",
+            value=False,
+            help="Ignore previously generated answers for this exact request",
         )
+        submitted = st.form_submit_button(
+            "🍽️ Get Meal Recommendations", type="primary", use_container_width=True
+        )
+
+    if submitted:
+        try:
+            # Format user inputs into a natural language goal
+            user_goal: str = format_user_goal(meal_request)
+        except ValueError as e:
+            # Handle validation errors (e.g., empty restaurant name)
+            st.warning(f"⚠️ {str(e)}")
+        else:
+            # Display the formatted request to the user
+            st.info(f"**Your request:** {user_goal}")
+
+            # Reset meal_logged flag when getting new recommendations
+            st.session_state.meal_logged = False
+            generate_meal_recommendations(
+                user_goal,
+                meal_request.restaurant,
+                meal_request.calories,
+                st.session_state.current_profile,
+                force_refresh=force_refresh,
+            )
 
     # Display previous recommendations if they exist
     display_previous_recommendations()
@@ -475,40 +331,45 @@ with col1:
         st.subheader("📊 Log This Meal")
         st.markdown("Help improve future recommendations by rating this meal!")
 
-        col_rate1, col_rate2 = st.columns(2)
+        with st.form("log_meal"):
+            col_rate1, col_rate2 = st.columns(2)
 
-        with col_rate1:
-            meal_rating = st.select_slider(
-                "How satisfied were you?",
-                options=[1, 2, 3, 4, 5],
-                value=3,
-                help="1 = Not satisfied, 5 = Very satisfied",
-                key="meal_rating_slider"
-            )
+            with col_rate1:
+                meal_rating = st.select_slider(
+                    "How satisfied were you?",
+                    options=[1, 2, 3, 4, 5],
+                    value=3,
+                    help="1 = Not satisfied, 5 = Very satisfied",
+                    key="meal_rating_slider"
+                )
 
-        with col_rate2:
-            if st.button("💾 Log Meal to History", use_container_width=True):
-                # Create meal entry
-                meal_entry = {
-                    "restaurant": st.session_state.get("last_restaurant", restaurant),
-                    "calories": st.session_state.get("last_calories", calories),
-                    "rating": meal_rating,
-                }
-
-                # Add to profile and update statistics
-                updated_profile = add_meal_to_history(
-                    st.session_state.current_profile, meal_entry
+            with col_rate2:
+                log_submitted = st.form_submit_button(
+                    "💾 Log Meal to History", use_container_width=True
                 )
-                
-                # Save to disk
-                if save_profile(st.session_state.profile_name, updated_profile):
-                    # Reload from disk to ensure sync
-                    st.session_state.current_profile = load_profile(st.session_state.profile_name)
-                    st.session_state.meal_logged = True
-                    st.success("✓ Meal logged successfully!")
-                    st.rerun()
-                else:
-                    st.error("Failed to log meal")
+
+        if log_submitted:
+            # Create meal entry
+            meal_entry = {
+                "restaurant": st.session_state.get("last_restaurant", meal_request.restaurant),
+                "calories": st.session_state.get("last_calories", meal_request.calories),
+                "rating": meal_rating,
+            }
+
+            # Add to profile and update statistics
+            updated_profile = add_meal_to_history(
+                st.session_state.current_profile, meal_entry
+            )
+            
+            # Save to disk
+            if save_profile_and_refresh(st.session_state.profile_name, updated_profile):
+                # The in-memory profile already holds the saved state
+                st.session_state.current_profile = updated_profile
+                st.session_state.meal_logged = True
+                st.success("✓ Meal logged successfully!")
+                st.rerun()
+            else:
+                st.error("Failed to log meal")
 
 with col2:
     # Information section explaining how the app works
@@ -8,15 +8,27 @@ Features:
 - Usage alerts
 """
 
+import atexit
 import os
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import logging
 from config.database import get_supabase_client, is_database_available
-from config.environments import get_config
+from config.environments import DAILY_COST_LIMIT, HOURLY_REQUEST_LIMIT
 
 logger = logging.getLogger(__name__)
 
+# Redis is optional; without it rate limiting uses the database or memory
+try:
+    import redis
+except ImportError:
+    redis = None
+
 
 # OpenAI pricing (as of 2024)
 MODEL_COSTS = {
@@ -25,16 +37,85 @@ MODEL_COSTS = {
     "gpt-3.5-turbo": {"input": 0.0005 / 1000, "output": 0.0015 / 1000},
 }
 
+# (input, output) per-token rates, flattened for a single lookup per estimate
+_MODEL_RATES = {model: (v["input"], v["output"]) for model, v in MODEL_COSTS.items()}
+# Unknown models are priced as gpt-3.5-turbo
+_DEFAULT_RATE = _MODEL_RATES["gpt-3.5-turbo"]
+
+# Seconds before cached usage totals are reloaded from the database
+USAGE_CACHE_TTL_SECONDS = 60.0
+
+# Below this fraction of every limit, admission skips the database checks
+FAST_PATH_WATERMARK = 0.5
+
+# Buffered api_usage rows are written when this many queue up, or every interval
+USAGE_FLUSH_BATCH_SIZE = 32
+USAGE_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Most rows kept for retry after failed inserts; older ones are dropped past this
+USAGE_PENDING_MAX_ROWS = USAGE_FLUSH_BATCH_SIZE * 32
+
+# Runs the parts of log_usage that may block on the network, off the caller's thread
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="usage-log")
+atexit.register(_executor.shutdown, wait=True)
+
+# Sorted set of request timestamps (ms) for the rolling hourly window
+RATE_LIMIT_KEY = "cost_control:requests"
+RATE_LIMIT_WINDOW_MS = 3_600_000
+
 
 class CostController:
     """Manages OpenAI API cost tracking and limits."""
     
     def __init__(self):
         """Initialize cost controller."""
-        self.daily_limit = get_config("daily_cost_limit", 0.17)
+        self.daily_limit = DAILY_COST_LIMIT
         self.monthly_limit = self.daily_limit * 30
-        self.hourly_request_limit = get_config("request_limit_per_hour", 20)
-        self._in_memory_usage: Dict[str, list] = {"requests": [], "costs": []}
+        self.hourly_request_limit = HOURLY_REQUEST_LIMIT
+        
+        # Divisors for usage percentages; clamped so a zero limit can't divide by zero
+        self._daily_limit_safe = max(self.daily_limit, 1e-9)
+        self._monthly_limit_safe = max(self.monthly_limit, 1e-9)
+        self._in_memory_usage: Dict[str, deque] = {"requests": deque(), "costs": deque()}
+        self._redis = self._connect_redis()
+        
+        # Guards the running totals, in-memory usage and day boundaries, which
+        # the script thread, the usage-log workers and health polls all touch
+        self._usage_lock = threading.RLock()
+        
+        # api_usage rows waiting for the background flusher, and their summed cost
+        self._pending_rows: List[dict] = []
+        self._pending_cost = 0.0
+        self._pending_lock = threading.Lock()
+        # Held while rows are inserted, so a reload never sees rows in flight
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        
+        # Day/month boundaries as epoch seconds plus their ISO filter strings,
+        # rebuilt only when the clock passes the end of the current day
+        self._today_start = 0.0
+        self._month_start = 0.0
+        self._day_end = 0.0
+        self._today_start_iso = ""
+        self._month_start_iso = ""
+        
+        # Running sums of the in-memory costs for today and this month
+        self._memory_daily_total = 0.0
+        self._memory_monthly_total = 0.0
+        
+        # Running usage totals, keyed by the boundary they were summed from and
+        # reloaded on rollover or after the cache TTL
+        self._daily_total = 0.0
+        self._monthly_total = 0.0
+        self._daily_bucket: Optional[float] = None
+        self._monthly_bucket: Optional[float] = None
+        self._daily_loaded_at = 0.0
+        self._monthly_loaded_at = 0.0
+        
+        # Every cost logged by this process; lets a reload add costs logged
+        # while it was querying
+        self._logged_cost = 0.0
     
     def estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """
@@ -48,15 +129,8 @@ class CostController:
         Returns:
             Estimated cost in USD
         """
-        if model not in MODEL_COSTS:
-            # Default to gpt-3.5-turbo pricing
-            model = "gpt-3.5-turbo"
-        
-        pricing = MODEL_COSTS[model]
-        input_cost = input_tokens * pricing["input"]
-        output_cost = output_tokens * pricing["output"]
-        
-        return input_cost + output_cost
+        input_rate, output_rate = _MODEL_RATES.get(model, _DEFAULT_RATE)
+        return input_tokens * input_rate + output_tokens * output_rate
     
     def can_make_request(self, estimated_cost: float = 0.01) -> Tuple[bool, str]:
         """
@@ -68,6 +142,10 @@ class CostController:
         Returns:
             Tuple of (can_make_request, reason_if_not)
         """
+        # Far below every limit: admit from cached totals without any I/O
+        if self._well_under_limits(estimated_cost):
+            return True, ""
+        
         # Check hourly rate limit
         if not self._check_rate_limit():
             return False, f"Hourly rate limit exceeded ({self.hourly_request_limit} requests/hour)"
@@ -84,76 +162,225 @@ class CostController:
         
         return True, ""
     
+    def _well_under_limits(self, estimated_cost: float) -> bool:
+        """
+        Check the cached totals and local request count against the watermark.
+        
+        Only trusted when the totals belong to the current day and month and
+        are younger than USAGE_CACHE_TTL_SECONDS; otherwise the full checks
+        run and reload them.
+        """
+        now = time.time()
+        self._refresh_boundaries(now)
+        if (
+            self._daily_bucket != self._today_start
+            or self._monthly_bucket != self._month_start
+        ):
+            return False
+        
+        loaded_at = time.monotonic()
+        if (
+            loaded_at - self._daily_loaded_at >= USAGE_CACHE_TTL_SECONDS
+            or loaded_at - self._monthly_loaded_at >= USAGE_CACHE_TTL_SECONDS
+        ):
+            return False
+        
+        return (
+            self._daily_total + estimated_cost < self.daily_limit * FAST_PATH_WATERMARK
+            and self._monthly_total + estimated_cost < self.monthly_limit * FAST_PATH_WATERMARK
+            and self._prune_requests(now) < self.hourly_request_limit * FAST_PATH_WATERMARK
+        )
+    
+    def _refresh_boundaries(self, now: float) -> None:
+        """Recompute today's and this month's start once the day has rolled over."""
+        if now < self._day_end:
+            return
+        
+        with self._usage_lock:
+            # Another thread may have rolled the boundaries meanwhile
+            if now < self._day_end:
+                return
+            self._roll_boundaries()
+    
+    def _roll_boundaries(self) -> None:
+        """Move the boundaries to today and re-derive the in-memory sums."""
+        today = date.today()
+        today_start = datetime(today.year, today.month, today.day)
+        month_start = today_start.replace(day=1)
+        
+        self._today_start = today_start.timestamp()
+        self._month_start = month_start.timestamp()
+        self._day_end = (today_start + timedelta(days=1)).timestamp()
+        self._today_start_iso = today_start.isoformat()
+        self._month_start_iso = month_start.isoformat()
+        
+        # Expire in-memory costs from previous months and re-derive the running
+        # sums; this only happens once a day
+        costs = self._in_memory_usage["costs"]
+        while costs and costs[0][0] <= self._month_start:
+            costs.popleft()
+        self._memory_monthly_total = sum(cost for _, cost in costs)
+        self._memory_daily_total = sum(
+            cost for ts, cost in costs if ts > self._today_start
+        )
+    
+    def _prune_requests(self, now: float) -> int:
+        """Drop requests older than an hour and return how many remain."""
+        # Timestamps are appended in order, so expired ones are at the front
+        requests = self._in_memory_usage["requests"]
+        one_hour_ago = now - 3600
+        with self._usage_lock:
+            while requests and requests[0] <= one_hour_ago:
+                requests.popleft()
+            return len(requests)
+    
+    @staticmethod
+    def _connect_redis():
+        """Create a Redis client when REDIS_URL is set and redis is installed."""
+        redis_url = os.getenv("REDIS_URL")
+        if not redis_url or redis is None:
+            return None
+        try:
+            return redis.Redis.from_url(redis_url)
+        except Exception as e:
+            logger.warning(f"Redis unavailable, rate limiting without it: {e}")
+            return None
+    
     def _check_rate_limit(self) -> bool:
         """Check if within hourly rate limit."""
-        now = datetime.now()
-        one_hour_ago = now - timedelta(hours=1)
+        now = time.time()
+        one_hour_ago = now - 3600
+        in_memory_count = self._prune_requests(now)
         
-        # Clean old requests from in-memory cache
-        self._in_memory_usage["requests"] = [
-            ts for ts in self._in_memory_usage["requests"] 
-            if ts > one_hour_ago
-        ]
+        # Rolling window in Redis: trim expired entries, then count the rest
+        if self._redis is not None:
+            try:
+                now_ms = int(now * 1000)
+                pipe = self._redis.pipeline()
+                pipe.zremrangebyscore(RATE_LIMIT_KEY, 0, now_ms - RATE_LIMIT_WINDOW_MS)
+                pipe.zcard(RATE_LIMIT_KEY)
+                pipe.expire(RATE_LIMIT_KEY, RATE_LIMIT_WINDOW_MS // 1000)
+                _, count, _ = pipe.execute()
+                return count < self.hourly_request_limit
+            except Exception as e:
+                logger.error(f"Error checking rate limit in Redis: {e}")
         
         # Check database if available
         if is_database_available():
             try:
                 client = get_supabase_client()
+                # Count server-side; head=True returns no rows, only the count
                 result = client.table("api_usage") \
-                    .select("id") \
-                    .gte("timestamp", one_hour_ago.isoformat()) \
+                    .select("id", count="exact", head=True) \
+                    .gte("timestamp", datetime.fromtimestamp(one_hour_ago).isoformat()) \
                     .execute()
                 
-                return len(result.data) < self.hourly_request_limit
+                return (result.count or 0) < self.hourly_request_limit
             except Exception as e:
                 logger.error(f"Error checking rate limit: {e}")
         
         # Fallback to in-memory tracking
-        return len(self._in_memory_usage["requests"]) < self.hourly_request_limit
+        return in_memory_count < self.hourly_request_limit
     
     def get_daily_usage(self) -> float:
-        """Get total cost for today."""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        """
+        Get total cost for today.
         
+        Served from the running total; the database is only queried when the
+        day rolls over or the cached total is older than USAGE_CACHE_TTL_SECONDS.
+        """
+        self._refresh_boundaries(time.time())
+        loaded_at = time.monotonic()
+        if (
+            self._daily_bucket != self._today_start
+            or loaded_at - self._daily_loaded_at >= USAGE_CACHE_TTL_SECONDS
+        ):
+            with self._flush_lock:
+                bucket = self._today_start
+                logged_before, pending = self._unstored_cost()
+                stored = self._load_daily_usage()
+                with self._usage_lock:
+                    if stored is None:
+                        # No database sum; the in-memory total already has every cost
+                        self._daily_total = self._memory_daily_total
+                    else:
+                        self._daily_total = stored + pending + self._logged_cost - logged_before
+                    self._daily_bucket = bucket
+                    self._daily_loaded_at = loaded_at
+        return self._daily_total
+    
+    def get_monthly_usage(self) -> float:
+        """
+        Get total cost for this month.
+        
+        Served from the running total; the database is only queried when the
+        month rolls over or the cached total is older than USAGE_CACHE_TTL_SECONDS.
+        """
+        self._refresh_boundaries(time.time())
+        loaded_at = time.monotonic()
+        if (
+            self._monthly_bucket != self._month_start
+            or loaded_at - self._monthly_loaded_at >= USAGE_CACHE_TTL_SECONDS
+        ):
+            with self._flush_lock:
+                bucket = self._month_start
+                logged_before, pending = self._unstored_cost()
+                stored = self._load_monthly_usage()
+                with self._usage_lock:
+                    if stored is None:
+                        # No database sum; the in-memory total already has every cost
+                        self._monthly_total = self._memory_monthly_total
+                    else:
+                        self._monthly_total = stored + pending + self._logged_cost - logged_before
+                    self._monthly_bucket = bucket
+                    self._monthly_loaded_at = loaded_at
+        return self._monthly_total
+    
+    def _unstored_cost(self) -> Tuple[float, float]:
+        """
+        Snapshot the logged-cost counter and the cost of rows not yet inserted.
+        
+        Reloads call this with _flush_lock held, so a sum loaded from the
+        database plus the pending cost plus whatever the counter gains during
+        the load covers every logged cost. A cost logged mid-load may be counted twice,
+        which errs toward the limit, but never dropped.
+        """
+        with self._usage_lock, self._pending_lock:
+            return self._logged_cost, self._pending_cost
+    
+    def _load_daily_usage(self) -> Optional[float]:
+        """Sum today's costs from the database; None if it is unavailable or the query fails."""
         if is_database_available():
             try:
                 client = get_supabase_client()
                 result = client.table("api_usage") \
                     .select("estimated_cost") \
-                    .gte("timestamp", today.isoformat()) \
+                    .gte("timestamp", self._today_start_iso) \
                     .execute()
                 
                 return sum(row["estimated_cost"] for row in result.data)
             except Exception as e:
                 logger.error(f"Error getting daily usage: {e}")
         
-        # Fallback to in-memory tracking
-        return sum(
-            cost for ts, cost in self._in_memory_usage["costs"]
-            if ts > today
-        )
+        # Caller falls back to in-memory tracking
+        return None
     
-    def get_monthly_usage(self) -> float:
-        """Get total cost for this month."""
-        first_of_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        
+    def _load_monthly_usage(self) -> Optional[float]:
+        """Sum this month's costs from the database; None if it is unavailable or the query fails."""
         if is_database_available():
             try:
                 client = get_supabase_client()
                 result = client.table("api_usage") \
                     .select("estimated_cost") \
-                    .gte("timestamp", first_of_month.isoformat()) \
+                    .gte("timestamp", self._month_start_iso) \
                     .execute()
                 
                 return sum(row["estimated_cost"] for row in result.data)
             except Exception as e:
                 logger.error(f"Error getting monthly usage: {e}")
         
-        # Fallback to in-memory tracking
-        return sum(
-            cost for ts, cost in self._in_memory_usage["costs"]
-            if ts > first_of_month
-        )
+        # Caller falls back to in-memory tracking
+        return None
     
     def log_usage(
         self,
@@ -168,6 +395,10 @@ class CostController:
         """
         Log API usage for tracking.
         
+        In-memory totals are updated immediately. Database rows are batched by
+        the flusher, and Redis and limit-warning work runs on a worker thread,
+        so the caller never waits on the network.
+        
         Args:
             model: Model used
             input_tokens: Input tokens used
@@ -179,17 +410,22 @@ class CostController:
         """
         cost = self.estimate_cost(model, input_tokens, output_tokens)
         total_tokens = input_tokens + output_tokens
-        now = datetime.now()
+        timestamp = time.time()
         
-        # Store in memory
-        self._in_memory_usage["requests"].append(now)
-        self._in_memory_usage["costs"].append((now, cost))
+        # Roll the boundaries first so the new cost lands in the right bucket
+        self._refresh_boundaries(timestamp)
         
-        # Log to database if available
-        if is_database_available():
-            try:
-                client = get_supabase_client()
-                client.table("api_usage").insert({
+        with self._usage_lock:
+            # Store in memory as epoch seconds; cheaper to compare than datetimes
+            self._in_memory_usage["requests"].append(timestamp)
+            self._in_memory_usage["costs"].append((timestamp, cost))
+            self._memory_daily_total += cost
+            self._memory_monthly_total += cost
+            self._logged_cost += cost
+            
+            # Queue for the database; rows are inserted in batches off this thread
+            if is_database_available():
+                self._enqueue_row({
                     "model": model,
                     "tokens_used": total_tokens,
                     "estimated_cost": cost,
@@ -197,15 +433,87 @@ class CostController:
                     "profile_id": profile_id,
                     "success": success,
                     "error_message": error_message,
-                }).execute()
+                })
+            
+            # Keep the cached totals current without another database round-trip
+            if self._daily_bucket == self._today_start:
+                self._daily_total += cost
+            if self._monthly_bucket == self._month_start:
+                self._monthly_total += cost
+        
+        _executor.submit(self._after_log_usage, timestamp)
+    
+    def _after_log_usage(self, timestamp: float) -> None:
+        """Record the request in Redis and warn near the daily limit (runs on _executor)."""
+        if self._redis is not None:
+            try:
+                now_ms = int(timestamp * 1000)
+                self._redis.zadd(RATE_LIMIT_KEY, {f"{now_ms}:{uuid.uuid4().hex}": now_ms})
             except Exception as e:
-                logger.error(f"Error logging usage to database: {e}")
+                logger.error(f"Error recording request in Redis: {e}")
         
-        # Log warning if approaching limits
-        daily_usage = self.get_daily_usage()
+        # Log warning if approaching limits; reads the running total, since a
+        # reload here could race the row this call just queued. A total cached
+        # for an earlier day is stale, so use the in-memory one instead
+        with self._usage_lock:
+            if self._daily_bucket == self._today_start:
+                daily_usage = self._daily_total
+            else:
+                daily_usage = self._memory_daily_total
         if daily_usage > self.daily_limit * 0.8:
             logger.warning(f"Approaching daily limit: ${daily_usage:.4f} / ${self.daily_limit:.2f}")
     
+    def _enqueue_row(self, row: dict) -> None:
+        """Buffer an api_usage row, starting the flusher on first use."""
+        with self._pending_lock:
+            self._pending_rows.append(row)
+            self._pending_cost += row["estimated_cost"]
+            pending = len(self._pending_rows)
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="usage-flush", daemon=True
+                )
+                self._flusher.start()
+                atexit.register(self.flush)
+        
+        if pending >= USAGE_FLUSH_BATCH_SIZE:
+            self._flush_requested.set()
+    
+    def _flush_loop(self) -> None:
+        """Write buffered rows every interval, or sooner when a batch fills."""
+        while True:
+            self._flush_requested.wait(USAGE_FLUSH_INTERVAL_SECONDS)
+            self._flush_requested.clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Insert all buffered api_usage rows in a single request."""
+        with self._flush_lock:
+            with self._pending_lock:
+                rows, self._pending_rows = self._pending_rows, []
+                self._pending_cost = 0.0
+            
+            if not rows:
+                return
+            
+            try:
+                client = get_supabase_client()
+                client.table("api_usage").insert(rows).execute()
+            except Exception as e:
+                logger.error(f"Error logging {len(rows)} usage rows to database: {e}")
+                self._requeue_rows(rows)
+    
+    def _requeue_rows(self, rows: List[dict]) -> None:
+        """Put rows from a failed insert back at the front of the buffer, oldest dropped past the cap."""
+        with self._pending_lock:
+            combined = rows + self._pending_rows
+            dropped = len(combined) - USAGE_PENDING_MAX_ROWS
+            if dropped > 0:
+                logger.warning(f"Dropping {dropped} unsaved usage rows; buffer is full")
+                combined = combined[dropped:]
+            self._pending_rows = combined
+            self._pending_cost = sum(row["estimated_cost"] for row in combined)
+    
     def get_usage_summary(self) -> Dict[str, any]:
         """Get usage summary statistics."""
         daily_usage = self.get_daily_usage()
@@ -215,11 +523,11 @@ class CostController:
             "daily_usage": daily_usage,
             "daily_limit": self.daily_limit,
             "daily_remaining": max(0, self.daily_limit - daily_usage),
-            "daily_percent": (daily_usage / self.daily_limit * 100) if self.daily_limit > 0 else 0,
+            "daily_percent": daily_usage / self._daily_limit_safe * 100,
             "monthly_usage": monthly_usage,
             "monthly_limit": self.monthly_limit,
             "monthly_remaining": max(0, self.monthly_limit - monthly_usage),
-            "monthly_percent": (monthly_usage / self.monthly_limit * 100) if self.monthly_limit > 0 else 0,
+            "monthly_percent": monthly_usage / self._monthly_limit_safe * 100,
         }
 
 
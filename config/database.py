@@ -9,22 +9,30 @@ This module handles:
 """
 
 import os
-from typing import Optional
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Optional
 import logging
 
+# supabase is imported only when a client is created, so JSON-only runs
+# never pay for loading it
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
 
 class DatabaseConfig:
     """Database configuration manager."""
     
+    __slots__ = ("supabase_url", "supabase_key", "use_database", "_client", "_available")
+    
     def __init__(self):
         """Initialize database configuration from environment variables."""
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
         self.use_database = self._should_use_database()
-        self._client: Optional[Client] = None
+        self._client: Optional["Client"] = None
+        # Memoized is_available() result; None until first checked
+        self._available: Optional[bool] = None
         
     def _should_use_database(self) -> bool:
         """Determine if database should be used based on config."""
@@ -34,22 +42,41 @@ class DatabaseConfig:
         return True
     
     @property
-    def client(self) -> Optional[Client]:
+    def client(self) -> Optional["Client"]:
         """Get or create Supabase client."""
         if not self.use_database:
             return None
             
         if self._client is None:
             try:
+                from supabase import create_client
+                
                 self._client = create_client(self.supabase_url, self.supabase_key)
                 logger.info("Supabase client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
-                self.use_database = False
+                self.invalidate()
                 return None
                 
         return self._client
     
+    def is_available(self) -> bool:
+        """
+        Check if the database is configured and a client could be created.
+        
+        The answer is memoized since it only changes when client creation
+        fails, which calls invalidate().
+        """
+        if self._available is None:
+            self._available = self.use_database and self.client is not None
+        return self._available
+    
+    def invalidate(self) -> None:
+        """Mark the database unavailable and drop the client."""
+        self.use_database = False
+        self._client = None
+        self._available = False
+    
     def health_check(self) -> bool:
         """Check database connection health."""
         if not self.use_database:
@@ -68,12 +95,12 @@ class DatabaseConfig:
 db_config = DatabaseConfig()
 
 
-def get_supabase_client() -> Optional[Client]:
+def get_supabase_client() -> Optional["Client"]:
     """Get Supabase client instance."""
     return db_config.client
 
 
 def is_database_available() -> bool:
     """Check if database is available and configured."""
-    return db_config.use_database and db_config.client is not None
+    return db_config.is_available()
 
@@ -9,6 +9,7 @@ Handles:
 """
 
 import os
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Any
 import logging
@@ -23,6 +24,24 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Immutable settings for one environment; fields are read as attributes."""
+    app_name: str
+    version: str
+    debug: bool
+    log_level: str
+    model: str
+    model_fallback: str
+    max_tokens: int
+    temperature: float
+    daily_cost_limit: float
+    request_limit_per_hour: int
+    enable_content_filter: bool
+    enable_monitoring: bool
+    enable_caching: bool = False
+
+
 class EnvironmentConfig:
     """Environment-specific configuration."""
     
@@ -46,7 +65,7 @@ class EnvironmentConfig:
             logger.warning(f"Unknown environment '{env_name}', defaulting to development")
             return Environment.DEVELOPMENT
     
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> AppConfig:
         """Load configuration based on environment."""
         base_config = {
             "app_name": "Fast Food Nutrition Agent",
@@ -56,7 +75,7 @@ class EnvironmentConfig:
         }
         
         if self.env == Environment.DEVELOPMENT:
-            return {
+            return AppConfig(**{
                 **base_config,
                 "debug": True,
                 "log_level": "DEBUG",
@@ -68,10 +87,10 @@ class EnvironmentConfig:
                 "request_limit_per_hour": 100,
                 "enable_content_filter": False,
                 "enable_monitoring": False,
-            }
+            })
         
         elif self.env == Environment.STAGING:
-            return {
+            return AppConfig(**{
                 **base_config,
                 "debug": True,
                 "log_level": "INFO",
@@ -83,10 +102,10 @@ class EnvironmentConfig:
                 "request_limit_per_hour": 50,
                 "enable_content_filter": True,
                 "enable_monitoring": True,
-            }
+            })
         
         else:  # PRODUCTION
-            return {
+            return AppConfig(**{
                 **base_config,
                 "debug": False,
                 "log_level": "WARNING",
@@ -99,11 +118,11 @@ class EnvironmentConfig:
                 "enable_content_filter": True,
                 "enable_monitoring": True,
                 "enable_caching": True,
-            }
+            })
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        return self.config.get(key, default)
+        return getattr(self.config, key, default)
     
     def is_production(self) -> bool:
         """Check if running in production."""
@@ -134,6 +153,10 @@ class EnvironmentConfig:
 # Global environment config instance
 env_config = EnvironmentConfig()
 
+# Frequently read settings, resolved once for the active environment
+DAILY_COST_LIMIT: float = env_config.config.daily_cost_limit
+HOURLY_REQUEST_LIMIT: int = env_config.config.request_limit_per_hour
+
 
 def get_environment() -> Environment:
     """Get current environment."""
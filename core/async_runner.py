@@ -0,0 +1,140 @@
+"""
+Background Event Loop for Synchronous Callers.
+
+Streamlit scripts are synchronous; running each agent call through
+asyncio.run creates and tears down an event loop per click, dropping any
+pooled HTTP connections bound to it. This module keeps one loop alive on
+a daemon thread and submits coroutines to it instead.
+
+Because every Streamlit session submits to the same loop, concurrent
+sessions share one OpenAI client and its warm connections, and identical
+in-flight requests are coalesced by the response cache. Requests from
+different sessions are deliberately not merged into one composite prompt:
+that would mix users' profile context and make answers depend on
+splitting free-form model output.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# uvloop is optional and POSIX-only; fall back to the stdlib loop without it
+try:
+    if sys.platform == "win32":
+        raise ImportError("uvloop is not supported on Windows")
+    import uvloop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """
+    Persistent asyncio event loop running on a daemon thread.
+
+    The loop is started lazily on first use and lives for the rest of the
+    process, so async clients created on it keep their connection pools.
+    """
+
+    def __init__(self):
+        """Initialize background loop (started on first use)."""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Get the running background loop, starting it if needed."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = new_event_loop()
+                    thread = threading.Thread(
+                        target=loop.run_forever,
+                        name="async-runner",
+                        daemon=True,
+                    )
+                    thread.start()
+                    self._loop = loop
+                    logger.info("Started background event loop")
+        return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional seconds to wait before raising TimeoutError
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            TimeoutError: If the coroutine doesn't finish within timeout
+                (it is cancelled on the loop)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(
+        self, agen: AsyncIterator[T], timeout: Optional[float] = None
+    ) -> Iterator[T]:
+        """
+        Consume an async iterator on the background loop from sync code.
+
+        Args:
+            agen: Async iterator to drain (e.g. a streaming response)
+            timeout: Optional seconds to wait for each item
+
+        Yields:
+            Items in the order the async iterator produces them
+
+        If the consumer stops early (e.g. a Streamlit rerun, an error or a
+        timeout), the async generator is closed on the loop so it stops
+        producing instead of running on in the background.
+        """
+        async def _next() -> T:
+            return await agen.__anext__()
+
+        exhausted = False
+        try:
+            while True:
+                try:
+                    yield self.run(_next(), timeout)
+                except StopAsyncIteration:
+                    exhausted = True
+                    return
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if not exhausted and aclose is not None:
+                asyncio.run_coroutine_threadsafe(aclose(), self.loop)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+# Global background loop
+background_loop = BackgroundLoop()
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the shared background loop (convenience function)."""
+    return background_loop.run(coro, timeout)
+
+
+def iter_async(agen: AsyncIterator[T], timeout: Optional[float] = None) -> Iterator[T]:
+    """Consume an async iterator on the shared background loop (convenience function)."""
+    return background_loop.iterate(agen, timeout)
@@ -5,8 +5,9 @@ Prevents cascading failures by temporarily blocking requests to failing services
 """
 
 import logging
-from datetime import datetime, timedelta
-from enum import Enum
+import threading
+import time
+from datetime import datetime
 from typing import Callable, Any, Optional
 from functools import wraps
 import asyncio
@@ -14,11 +15,12 @@ import asyncio
 logger = logging.getLogger(__name__)
 
 
-class CircuitState(Enum):
-    """Circuit breaker states."""
-    CLOSED = "closed"  # Normal operation
-    OPEN = "open"      # Blocking requests
-    HALF_OPEN = "half_open"  # Testing if service recovered
+# Circuit breaker states; plain ints keep the per-call state checks cheap
+CLOSED = 0     # Normal operation
+OPEN = 1       # Blocking requests
+HALF_OPEN = 2  # Testing if service recovered
+
+_STATE_NAMES = {CLOSED: "closed", OPEN: "open", HALF_OPEN: "half_open"}
 
 
 class CircuitBreaker:
@@ -31,6 +33,20 @@ class CircuitBreaker:
     - HALF_OPEN: Testing recovery, limited requests allowed
     """
     
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "success_threshold",
+        "name",
+        "state",
+        "failure_count",
+        "success_count",
+        "last_failure_time",
+        "last_state_change",
+        "_lock",
+        "_status",
+    )
+    
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -52,11 +68,19 @@ class CircuitBreaker:
         self.success_threshold = success_threshold
         self.name = name
         
-        self.state = CircuitState.CLOSED
+        self.state = CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.last_state_change: datetime = datetime.now()
+        # Epoch seconds; converted to datetimes only in get_status
+        self.last_failure_time: Optional[float] = None
+        self.last_state_change: float = time.time()
+        
+        # Guards state transitions; held briefly and never across an await,
+        # so it is safe for both sync and async callers
+        self._lock = threading.Lock()
+        
+        # get_status() result, rebuilt only after the breaker changes
+        self._status: Optional[dict] = None
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -73,17 +97,9 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                logger.info(f"Circuit {self.name}: Attempting reset (HALF_OPEN)")
-                self.state = CircuitState.HALF_OPEN
-                self.success_count = 0
-            else:
-                logger.warning(f"Circuit {self.name}: OPEN - Request blocked")
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is OPEN. "
-                    f"Service temporarily unavailable."
-                )
+        # Unlocked fast read; only an OPEN circuit needs the lock
+        if self.state == OPEN:
+            self._check_open()
         
         try:
             result = func(*args, **kwargs)
@@ -108,17 +124,9 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        if self.state == CircuitState.OPEN:
-            if self._should_attempt_reset():
-                logger.info(f"Circuit {self.name}: Attempting reset (HALF_OPEN)")
-                self.state = CircuitState.HALF_OPEN
-                self.success_count = 0
-            else:
-                logger.warning(f"Circuit {self.name}: OPEN - Request blocked")
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is OPEN. "
-                    f"Service temporarily unavailable."
-                )
+        # Unlocked fast read; only an OPEN circuit needs the lock
+        if self.state == OPEN:
+            self._check_open()
         
         try:
             result = await func(*args, **kwargs)
@@ -128,74 +136,132 @@ class CircuitBreaker:
             self._on_failure()
             raise
     
+    def _check_open(self) -> None:
+        """
+        Let a request through an OPEN circuit once the recovery timeout passes.
+        
+        Raises:
+            CircuitBreakerError: If the circuit is still open
+        """
+        with self._lock:
+            # Another caller may have transitioned the circuit meanwhile
+            if self.state != OPEN:
+                return
+            if self._should_attempt_reset():
+                logger.info(f"Circuit {self.name}: Attempting reset (HALF_OPEN)")
+                self.state = HALF_OPEN
+                self.success_count = 0
+                self._status = None
+                return
+        
+        logger.warning(f"Circuit {self.name}: OPEN - Request blocked")
+        raise CircuitBreakerError(
+            f"Circuit breaker '{self.name}' is OPEN. "
+            f"Service temporarily unavailable."
+        )
+    
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
         if self.last_failure_time is None:
             return True
         
-        time_since_failure = datetime.now() - self.last_failure_time
-        return time_since_failure > timedelta(seconds=self.recovery_timeout)
+        return time.time() - self.last_failure_time > self.recovery_timeout
     
     def _on_success(self):
         """Handle successful execution."""
-        if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
-            logger.info(
-                f"Circuit {self.name}: Success in HALF_OPEN "
-                f"({self.success_count}/{self.success_threshold})"
-            )
-            
-            if self.success_count >= self.success_threshold:
-                logger.info(f"Circuit {self.name}: CLOSED - Service recovered")
-                self.state = CircuitState.CLOSED
-                self.failure_count = 0
-                self.success_count = 0
-                self.last_state_change = datetime.now()
+        # Nothing to record in the common case of a healthy circuit
+        if self.state == CLOSED and self.failure_count == 0:
+            return
         
-        elif self.state == CircuitState.CLOSED:
-            # Reset failure count on success
-            self.failure_count = max(0, self.failure_count - 1)
+        with self._lock:
+            self._status = None
+            if self.state == HALF_OPEN:
+                self.success_count += 1
+                logger.info(
+                    f"Circuit {self.name}: Success in HALF_OPEN "
+                    f"({self.success_count}/{self.success_threshold})"
+                )
+                
+                if self.success_count >= self.success_threshold:
+                    logger.info(f"Circuit {self.name}: CLOSED - Service recovered")
+                    self.state = CLOSED
+                    self.failure_count = 0
+                    self.success_count = 0
+                    self.last_state_change = time.time()
+            
+            elif self.state == CLOSED:
+                # Reset failure count on success
+                self.failure_count = max(0, self.failure_count - 1)
     
     def _on_failure(self):
         """Handle failed execution."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-        
-        logger.warning(
-            f"Circuit {self.name}: Failure "
-            f"({self.failure_count}/{self.failure_threshold})"
-        )
-        
-        if self.state == CircuitState.HALF_OPEN:
-            logger.warning(f"Circuit {self.name}: OPEN - Recovery failed")
-            self.state = CircuitState.OPEN
-            self.success_count = 0
-            self.last_state_change = datetime.now()
-        
-        elif self.failure_count >= self.failure_threshold:
-            logger.error(f"Circuit {self.name}: OPEN - Threshold exceeded")
-            self.state = CircuitState.OPEN
-            self.last_state_change = datetime.now()
+        # One clock read serves both the failure time and any state change
+        now = time.time()
+        with self._lock:
+            self._status = None
+            self.failure_count += 1
+            # An already-OPEN circuit keeps the failure time that tripped it,
+            # so late in-flight failures don't push back the recovery timer
+            if self.state != OPEN:
+                self.last_failure_time = now
+            
+            logger.warning(
+                f"Circuit {self.name}: Failure "
+                f"({self.failure_count}/{self.failure_threshold})"
+            )
+            
+            if self.state == HALF_OPEN:
+                logger.warning(f"Circuit {self.name}: OPEN - Recovery failed")
+                self.state = OPEN
+                self.success_count = 0
+                self.last_state_change = now
+            
+            # Only a CLOSED circuit trips; in-flight calls failing after it
+            # opened must not re-open it or repeat the log
+            elif self.state == CLOSED and self.failure_count >= self.failure_threshold:
+                logger.error(f"Circuit {self.name}: OPEN - Threshold exceeded")
+                self.state = OPEN
+                self.last_state_change = now
     
     def reset(self):
         """Manually reset circuit breaker."""
         logger.info(f"Circuit {self.name}: Manual reset")
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.success_count = 0
-        self.last_failure_time = None
-        self.last_state_change = datetime.now()
+        with self._lock:
+            self.state = CLOSED
+            self.failure_count = 0
+            self.success_count = 0
+            self.last_failure_time = None
+            self.last_state_change = time.time()
+            self._status = None
     
     def get_status(self) -> dict:
-        """Get circuit breaker status."""
-        return {
-            "name": self.name,
-            "state": self.state.value,
-            "failure_count": self.failure_count,
-            "success_count": self.success_count,
-            "last_failure": self.last_failure_time.isoformat() if self.last_failure_time else None,
-            "last_state_change": self.last_state_change.isoformat(),
-        }
+        """
+        Get circuit breaker status.
+        
+        The dict is cached until the breaker's state or counters change, so
+        polling dashboards don't reformat timestamps on every rerun. Treat it
+        as read-only.
+        """
+        status = self._status
+        if status is None:
+            # Build under the lock so a concurrent change can't be cached stale
+            with self._lock:
+                status = {
+                    "name": self.name,
+                    "state": _STATE_NAMES[self.state],
+                    "failure_count": self.failure_count,
+                    "success_count": self.success_count,
+                    "last_failure": (
+                        datetime.fromtimestamp(self.last_failure_time).isoformat()
+                        if self.last_failure_time is not None
+                        else None
+                    ),
+                    "last_state_change": datetime.fromtimestamp(
+                        self.last_state_change
+                    ).isoformat(),
+                }
+                self._status = status
+        return status
 
 
 class CircuitBreakerError(Exception):
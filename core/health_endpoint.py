@@ -5,6 +5,7 @@ Provides health status that can be displayed in the UI or queried externally.
 """
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any
 import logging
@@ -14,11 +15,73 @@ from config.cost_control import get_usage_stats
 
 logger = logging.getLogger(__name__)
 
+# Seconds a status snapshot is reused across Streamlit reruns
+HEALTH_CACHE_TTL_SECONDS = 5
+
+# Seconds to wait for each status section before reporting it as failed
+STATUS_TIMEOUT_SECONDS = 10
+
+# Sections of the full status and the function that fills each
+_STATUS_SOURCES = {
+    "health": get_health,
+    "circuit_breakers": get_all_circuit_breaker_status,
+    "cost_status": get_usage_stats,
+}
+
+# Polls the status sections in parallel
+_executor = ThreadPoolExecutor(
+    max_workers=len(_STATUS_SOURCES), thread_name_prefix="health-status"
+)
+
+
+def get_full_status(timeout: float = STATUS_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """
+    Poll health, circuit breaker and cost status concurrently.
+    
+    Args:
+        timeout: Seconds to wait for each section
+        
+    Returns:
+        Dictionary keyed by section; a section that fails or times out
+        holds {"error": message} instead of its data
+    """
+    futures = {
+        section: _executor.submit(source)
+        for section, source in _STATUS_SOURCES.items()
+    }
+    
+    status = {}
+    for section, future in futures.items():
+        try:
+            status[section] = future.result(timeout)
+        except Exception as e:
+            logger.error(f"Failed to get {section}: {e!r}")
+            status[section] = {"error": str(e) or type(e).__name__}
+    return status
+
+
+@st.cache_data(ttl=HEALTH_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_full_status() -> Dict[str, Any]:
+    """Get the full status, polled at most once per TTL."""
+    return get_full_status()
+
+
+def clear_health_cache() -> None:
+    """Drop the cached snapshot so the next render polls every subsystem."""
+    _cached_full_status.clear()
+
 
 def render_health_dashboard():
     """Render health check dashboard in Streamlit sidebar."""
     with st.sidebar.expander("🏥 System Health", expanded=False):
-        health = get_health()
+        if st.button("🔄 Refresh", key="refresh_health"):
+            clear_health_cache()
+        
+        full_status = _cached_full_status()
+        health = full_status["health"]
+        if "error" in health:
+            st.error(f"Health data unavailable: {health['error']}")
+            return
         
         # Overall status
         status_emoji = {
@@ -30,7 +93,7 @@ def render_health_dashboard():
         
         overall_status = health["status"]
         st.markdown(f"### {status_emoji.get(overall_status, '❓')} {overall_status.upper()}")
-        st.caption(f"Last checked: {datetime.now().strftime('%H:%M:%S')}")
+        st.caption(f"Last checked: {health['timestamp'].split('T')[1][:8]}")
         
         st.markdown("---")
         
@@ -56,8 +119,8 @@ def render_health_dashboard():
                 st.markdown(f"• Monthly: `{budget['monthly_usage']}`/`{budget['monthly_limit']}`")
         
         # Circuit breakers
-        circuit_status = get_all_circuit_breaker_status()
-        if circuit_status:
+        circuit_status = full_status["circuit_breakers"]
+        if circuit_status and "error" not in circuit_status:
             st.markdown("---")
             st.markdown("**Circuit Breakers:**")
             for name, status in circuit_status.items():
@@ -73,9 +136,12 @@ def render_health_dashboard():
 def render_cost_dashboard():
     """Render cost monitoring dashboard in Streamlit sidebar."""
     with st.sidebar.expander("💰 Cost Monitor", expanded=False):
+        stats = _cached_full_status()["cost_status"]
+        if "error" in stats:
+            st.error(f"💸 Cost data unavailable: {stats['error']}")
+            return
+        
         try:
-            stats = get_usage_stats()
-            
             # Daily Usage
             st.markdown("**Daily Usage:**")
             daily_percent = min(100, stats['daily_percent'])
@@ -115,28 +181,20 @@ def get_health_json() -> Dict[str, Any]:
     Returns:
         Health status dictionary
     """
-    try:
-        health = get_health()
-        
-        # Add circuit breaker status
-        health["circuit_breakers"] = get_all_circuit_breaker_status()
-        
-        # Add cost status
-        try:
-            health["cost_status"] = get_usage_stats()
-        except Exception as e:
-            logger.error(f"Failed to get cost stats: {e}")
-            health["cost_status"] = {"error": str(e)}
-        
-        return health
-        
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
+    full_status = _cached_full_status()
+    health = full_status["health"]
+    
+    if "error" in health:
         return {
             "status": "unhealthy",
-            "error": str(e),
+            "error": health["error"],
             "timestamp": datetime.now().isoformat()
         }
+    
+    # Circuit breaker and cost sections degrade independently to {"error": ...}
+    health["circuit_breakers"] = full_status["circuit_breakers"]
+    health["cost_status"] = full_status["cost_status"]
+    return health
 
 
 def display_detailed_health():
@@ -173,7 +231,7 @@ def display_detailed_health():
             st.json(details)
     
     # Circuit Breakers
-    if health.get("circuit_breakers"):
+    if health.get("circuit_breakers") and "error" not in health["circuit_breakers"]:
         st.subheader("Circuit Breakers")
         for name, status in health["circuit_breakers"].items():
             col1, col2, col3 = st.columns(3)
@@ -0,0 +1,257 @@
+"""
+Response Cache for Agent Recommendations.
+
+Serves repeated requests, and requests whose free-text notes are worded
+differently, without another LLM round-trip.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Small, inexpensive embedding model used for similarity lookups
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+EmbedFunction = Callable[[str], Awaitable[List[float]]]
+
+
+class SemanticResponseCache:
+    """
+    Two-tier cache for agent responses.
+
+    Tiers:
+    - Exact: SHA-256 of namespace + text + notes, checked before any embedding call
+    - Semantic: cosine similarity of notes embeddings, only among entries with
+      the same namespace and text
+
+    The text carries the parts of a request that must match exactly (e.g.
+    restaurant, calories, restrictions); only the free-text notes are ever
+    matched by similarity, and requests without notes use the exact tier only.
+
+    Concurrent misses for the same key are coalesced: the first caller
+    computes the response and the others await its result.
+
+    The namespace scopes lookups (e.g. a user-profile fingerprint) so that
+    similar requests from users with different context never share answers.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 256,
+        embed_fn: Optional[EmbedFunction] = None,
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum cached responses before evicting the oldest
+            embed_fn: Async function returning an embedding for a text
+                (defaults to the OpenAI embeddings API)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._embed_fn = embed_fn or self._openai_embed
+        self._client = None
+
+        self._exact: "OrderedDict[str, str]" = OrderedDict()
+        self._vectors: "OrderedDict[str, Tuple[str, List[float]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_or_compute(
+        self,
+        text: str,
+        compute: Callable[[], Awaitable[str]],
+        namespace: str = "",
+        notes: str = "",
+    ) -> str:
+        """
+        Return a cached response for a request, or compute and cache a new one.
+
+        Args:
+            text: Request fields that must match exactly
+            compute: Coroutine factory producing the response on a miss
+            namespace: Scope for lookups (e.g. profile fingerprint)
+            notes: Free-text part of the request, matched by similarity
+
+        Returns:
+            Cached or freshly computed response
+        """
+        scope = self._make_scope(namespace, text)
+        key = self._make_key(scope, notes)
+        cached = self._exact.get(key)
+        if cached is not None:
+            self._exact.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._lookup_or_compute(key, scope, notes, compute)
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _lookup_or_compute(
+        self,
+        key: str,
+        scope: str,
+        notes: str,
+        compute: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Check the semantic tier, then compute and store on a miss."""
+        # Without notes there is nothing to match loosely; skip the embedding call
+        vector = await self._embed(notes) if notes else None
+        if vector is not None:
+            match = self._find_similar(scope, vector)
+            if match is not None:
+                self.semantic_hits += 1
+                return match
+
+        self.misses += 1
+        response = await compute()
+        self._store(key, scope, vector, response)
+        return response
+
+    def get(self, text: str, namespace: str = "", notes: str = "") -> Optional[str]:
+        """
+        Look up an exact-match response without computing one.
+
+        Args:
+            text: Request fields that must match exactly
+            namespace: Scope for lookups (e.g. profile fingerprint)
+            notes: Free-text part of the request
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        key = self._make_key(self._make_scope(namespace, text), notes)
+        cached = self._exact.get(key)
+        if cached is not None:
+            self._exact.move_to_end(key)
+            self.hits += 1
+        return cached
+
+    def put(
+        self, text: str, response: str, namespace: str = "", notes: str = ""
+    ) -> None:
+        """
+        Store a response produced outside get_or_compute (e.g. by streaming).
+
+        Only the exact tier is filled, so no embedding call is made; callers
+        that stream read responses back with get().
+
+        Args:
+            text: Request fields that must match exactly
+            response: Response to cache
+            namespace: Scope for lookups (e.g. profile fingerprint)
+            notes: Free-text part of the request
+        """
+        scope = self._make_scope(namespace, text)
+        self._store(self._make_key(scope, notes), scope, None, response)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._vectors.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._exact),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    @staticmethod
+    def _make_scope(namespace: str, text: str) -> str:
+        """Build the scope that semantic matches must share."""
+        return hashlib.sha256(f"{namespace}\x00{text}".encode()).hexdigest()
+
+    @staticmethod
+    def _make_key(scope: str, notes: str) -> str:
+        """Build the exact-match key for a request."""
+        return hashlib.sha256(f"{scope}\x00{notes}".encode()).hexdigest()
+
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed and L2-normalize text; returns None if embedding fails."""
+        try:
+            vector = await self._embed_fn(text)
+        except Exception as e:
+            # Fail open - the exact tier still works without embeddings
+            logger.warning(f"Embedding failed, skipping semantic cache: {e}")
+            return None
+
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return None
+        return [x / norm for x in vector]
+
+    def _find_similar(self, scope: str, vector: List[float]) -> Optional[str]:
+        """Find the best cached response above the similarity threshold."""
+        best_key, best_score = None, self.similarity_threshold
+        for key, (entry_scope, entry_vector) in self._vectors.items():
+            if entry_scope != scope:
+                continue
+            score = sum(a * b for a, b in zip(vector, entry_vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        self._exact.move_to_end(best_key)
+        return self._exact[best_key]
+
+    def _store(
+        self, key: str, scope: str, vector: Optional[List[float]], response: str
+    ) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self._exact[key] = response
+        if vector is not None:
+            self._vectors[key] = (scope, vector)
+
+        while len(self._exact) > self.max_entries:
+            evicted_key, _ = self._exact.popitem(last=False)
+            self._vectors.pop(evicted_key, None)
+
+    async def _openai_embed(self, text: str) -> List[float]:
+        """Embed text with the OpenAI embeddings API."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI()
+
+        response = await self._client.embeddings.create(
+            model=EMBEDDING_MODEL, input=text
+        )
+        return response.data[0].embedding
+
+
+# Global response cache
+response_cache = SemanticResponseCache()
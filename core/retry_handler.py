@@ -43,13 +43,16 @@ class RetryHandler:
         self.exponential_base = exponential_base
         self.jitter = jitter
         self.retriable_exceptions = retriable_exceptions
+        
+        # Capped backoff for each attempt; the settings are fixed after init
+        self._delays = [
+            min(base_delay * (exponential_base ** attempt), max_delay)
+            for attempt in range(max_retries + 1)
+        ]
     
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay for given attempt with exponential backoff."""
-        delay = min(
-            self.base_delay * (self.exponential_base ** attempt),
-            self.max_delay
-        )
+        delay = self._delays[attempt]
         
         if self.jitter:
             # Add random jitter (0-50% of delay)
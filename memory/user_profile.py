@@ -7,19 +7,72 @@ preferences, meal history, and statistics.
 Now with Supabase integration for production with automatic JSON fallback.
 """
 
+import csv
 import json
 import os
-from datetime import datetime
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from functools import wraps
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 from config.database import get_supabase_client, is_database_available
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; profile files use the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Directory to store user profiles (fallback storage)
 PROFILES_DIR = Path("data/profiles")
 
+# Maximum meals kept in a profile's history
+MAX_MEAL_HISTORY = 30
+
+# Derived values memoized on the profile dict; never persisted
+CACHE_KEY = "_cached"
+
+# How long memoized meal lookups stay valid on a profile
+MEAL_CACHE_TTL_SECONDS = 5.0
+
+# Meal fields exported by export_meal_history_csv, in column order
+MEAL_CSV_FIELDS = (
+    "timestamp",
+    "restaurant",
+    "calories",
+    "protein",
+    "sodium",
+    "rating",
+    "notes",
+)
+
+# Cached CSV name -> (preference list, max items joined)
+_PREFERENCE_CSVS = {
+    "restrictions_csv": ("dietary_restrictions", None),
+    "dislikes_csv": ("disliked_items", None),
+    "methods_csv": ("preferred_cooking_methods", None),
+    "fav_restaurants_csv": ("favorite_restaurants", 3),
+}
+
+
+def _dump_profile_json(data: Dict) -> bytes:
+    """Serialize a profile to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _parse_profile_json(raw: bytes) -> Dict:
+    """Parse a profile file's contents."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def ensure_profiles_directory() -> None:
     """Create the profiles directory if it doesn't exist."""
@@ -47,6 +100,9 @@ def create_default_profile() -> Dict:
             "avg_daily_calories": 0,
             "most_visited_restaurant": None,
             "profile_created": datetime.now().isoformat(),
+            "calories_total": 0,
+            "ratings_total": 0,
+            "ratings_count": 0,
         },
     }
 
@@ -57,8 +113,15 @@ def _save_profile_to_json(profile_name: str, profile_data: Dict) -> bool:
         ensure_profiles_directory()
         file_path = PROFILES_DIR / f"{profile_name}.json"
 
-        with open(file_path, "w") as f:
-            json.dump(profile_data, f, indent=2)
+        persisted = {k: v for k, v in profile_data.items() if k != CACHE_KEY}
+
+        # Write to a temp file and swap it in so readers never see a partial profile
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_dump_profile_json(persisted))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
 
         return True
     except Exception as e:
@@ -91,7 +154,8 @@ def _save_profile_to_database(profile_name: str, profile_data: Dict) -> bool:
             "avg_meal_rating": stats.get("avg_meal_rating", 0),
         }
         
-        if result.data:
+        existing = bool(result.data)
+        if existing:
             # Update existing profile
             profile_id = result.data[0]["id"]
             client.table("user_profiles") \
@@ -105,28 +169,44 @@ def _save_profile_to_database(profile_name: str, profile_data: Dict) -> bool:
                 .execute()
             profile_id = result.data[0]["id"]
         
-        # Save meal history
+        # Sync meal history: insert meals the database lacks, delete trimmed ones
         meal_history = profile_data.get("meal_history", [])
-        if meal_history:
-            # Delete old meal history for this profile
+        for meal in meal_history:
+            # Meals saved before ids were assigned get one now
+            meal.setdefault("id", str(uuid.uuid4()))
+
+        stored_ids = set()
+        if existing:
+            stored = client.table("meal_history") \
+                .select("id") \
+                .eq("profile_id", profile_id) \
+                .execute()
+            stored_ids = {row["id"] for row in stored.data}
+        current_ids = {meal["id"] for meal in meal_history}
+
+        new_records = [
+            {
+                "id": meal["id"],
+                "profile_id": profile_id,
+                "restaurant": meal.get("restaurant", "Unknown"),
+                "calories": meal.get("calories", 0),
+                "rating": meal.get("rating"),
+                "timestamp": meal.get("timestamp", datetime.now().isoformat()),
+            }
+            for meal in meal_history
+            if meal["id"] not in stored_ids
+        ]
+        if new_records:
+            client.table("meal_history") \
+                .upsert(new_records, on_conflict="id") \
+                .execute()
+
+        removed_ids = stored_ids - current_ids
+        if removed_ids:
             client.table("meal_history") \
                 .delete() \
-                .eq("profile_id", profile_id) \
+                .in_("id", list(removed_ids)) \
                 .execute()
-            
-            # Insert new meal history
-            meal_records = []
-            for meal in meal_history:
-                meal_records.append({
-                    "profile_id": profile_id,
-                    "restaurant": meal.get("restaurant", "Unknown"),
-                    "calories": meal.get("calories", 0),
-                    "rating": meal.get("rating"),
-                    "timestamp": meal.get("timestamp", datetime.now().isoformat()),
-                })
-            
-            if meal_records:
-                client.table("meal_history").insert(meal_records).execute()
         
         return True
     except Exception as e:
@@ -165,8 +245,8 @@ def _load_profile_from_json(profile_name: str) -> Optional[Dict]:
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return _parse_profile_json(f.read())
     except Exception as e:
         logger.error(f"Error loading profile from JSON: {e}")
         return None
@@ -194,13 +274,14 @@ def _load_profile_from_database(profile_name: str) -> Optional[Dict]:
             .select("*") \
             .eq("profile_id", profile_id) \
             .order("timestamp", desc=True) \
-            .limit(30) \
+            .limit(MAX_MEAL_HISTORY) \
             .execute()
         
         # Convert to old format
         meal_history = []
         for meal in meals_result.data:
             meal_history.append({
+                "id": meal["id"],
                 "restaurant": meal["restaurant"],
                 "calories": meal["calories"],
                 "rating": meal.get("rating"),
@@ -298,19 +379,154 @@ def add_meal_to_history(profile_data: Dict, meal_data: Dict) -> Dict:
     if "timestamp" not in meal_data:
         meal_data["timestamp"] = datetime.now().isoformat()
 
+    # Stable id so database saves only insert meals they haven't stored yet
+    meal_data.setdefault("id", str(uuid.uuid4()))
+
     # Add to history
     profile_data["meal_history"].append(meal_data)
+    invalidate_profile_cache(profile_data)
+
+    # Keep today's running totals so readers don't rescan the history
+    _update_todays_totals(profile_data, meal_data)
 
-    # Keep only last 30 meals
-    if len(profile_data["meal_history"]) > 30:
-        profile_data["meal_history"] = profile_data["meal_history"][-30:]
+    # Keep only the last MAX_MEAL_HISTORY meals, trimming in place
+    evicted = profile_data["meal_history"][:-MAX_MEAL_HISTORY]
+    del profile_data["meal_history"][:-MAX_MEAL_HISTORY]
 
     # Update statistics
-    profile_data = update_statistics(profile_data)
+    _update_statistics_for_meal(profile_data, meal_data, evicted)
 
     return profile_data
 
 
+def _update_statistics_for_meal(
+    profile_data: Dict, added: Dict, evicted: List[Dict]
+) -> None:
+    """
+    Adjust statistics for one added meal and any meals trimmed off the history.
+
+    Uses the running sums kept in stats, falling back to a full
+    update_statistics for profiles that don't carry them yet.
+    """
+    stats = profile_data["stats"]
+    if "calories_total" not in stats:
+        update_statistics(profile_data)
+        return
+
+    meals = profile_data["meal_history"]
+    stats["total_meals_tracked"] = len(meals)
+
+    stats["calories_total"] += added.get("calories", 0)
+    if added.get("rating"):
+        stats["ratings_total"] += added["rating"]
+        stats["ratings_count"] += 1
+    for meal in evicted:
+        stats["calories_total"] -= meal.get("calories", 0)
+        if meal.get("rating"):
+            stats["ratings_total"] -= meal["rating"]
+            stats["ratings_count"] -= 1
+
+    stats["avg_daily_calories"] = round(stats["calories_total"] / len(meals), 1)
+    if stats["ratings_count"]:
+        stats["avg_meal_rating"] = round(stats["ratings_total"] / stats["ratings_count"], 1)
+
+    # The leader can only change if another restaurant gained a visit or it lost one
+    leader = stats.get("most_visited_restaurant")
+    added_restaurant = added.get("restaurant")
+    if (added_restaurant and added_restaurant != leader) or any(
+        meal.get("restaurant") == leader for meal in evicted
+    ):
+        visits = Counter(m["restaurant"] for m in meals if m.get("restaurant"))
+        if visits:
+            stats["most_visited_restaurant"] = visits.most_common(1)[0][0]
+
+
+def _update_todays_totals(profile_data: Dict, meal_data: Dict) -> None:
+    """Add a logged meal to today's running totals, resetting on a new day."""
+    stats = profile_data["stats"]
+    today = datetime.now().date().isoformat()
+
+    if stats.get("today_date") != today:
+        # First meal since midnight: start counting from today's logged meals
+        todays_meals = get_todays_meals(profile_data)
+        stats["today_date"] = today
+        stats["meals_today_count"] = len(todays_meals)
+        stats["calories_today"] = sum(m.get("calories", 0) for m in todays_meals)
+        return
+
+    try:
+        meal_date = datetime.fromisoformat(meal_data["timestamp"]).date().isoformat()
+    except (KeyError, ValueError):
+        return
+
+    if meal_date == today:
+        stats["meals_today_count"] = stats.get("meals_today_count", 0) + 1
+        stats["calories_today"] = stats.get("calories_today", 0) + meal_data.get("calories", 0)
+
+
+def get_todays_totals(profile_data: Dict) -> Tuple[int, int]:
+    """
+    Get the number of meals and calories logged today.
+
+    Uses the running totals kept by add_meal_to_history and only scans
+    the meal history for profiles that don't carry them yet.
+
+    Args:
+        profile_data: User profile dictionary
+
+    Returns:
+        Tuple of (meal_count, total_calories)
+    """
+    stats = profile_data.get("stats", {})
+    today_date = stats.get("today_date")
+
+    if today_date is None:
+        todays_meals = get_todays_meals(profile_data)
+        return len(todays_meals), sum(m.get("calories", 0) for m in todays_meals)
+
+    if today_date != datetime.now().date().isoformat():
+        return 0, 0
+
+    return stats.get("meals_today_count", 0), stats.get("calories_today", 0)
+
+
+def get_preference_csvs(profile_data: Dict) -> Dict[str, str]:
+    """
+    Get the comma-joined preference lists used in prompts.
+
+    The joined strings are memoized under profile_data["_cached"] so repeated
+    prompt builds don't re-join lists that rarely change. Call
+    invalidate_profile_cache after mutating user_preferences.
+
+    Args:
+        profile_data: User profile dictionary
+
+    Returns:
+        Dictionary with restrictions_csv, dislikes_csv, methods_csv and
+        fav_restaurants_csv (empty strings when a list is empty)
+    """
+    cached = profile_data.setdefault(CACHE_KEY, {})
+    csvs = cached.get("preference_csvs")
+    if csvs is None:
+        prefs = profile_data.get("user_preferences", {})
+        csvs = {
+            name: ", ".join(prefs.get(field, [])[:limit])
+            for name, (field, limit) in _PREFERENCE_CSVS.items()
+        }
+        cached["preference_csvs"] = csvs
+    return csvs
+
+
+def invalidate_profile_cache(profile_data: Dict) -> None:
+    """
+    Drop values memoized on a profile after its preferences change.
+
+    Args:
+        profile_data: User profile dictionary
+    """
+    profile_data.pop(CACHE_KEY, None)
+
+
 def update_statistics(profile_data: Dict) -> Dict:
     """
     Update profile statistics based on meal history.
@@ -329,25 +545,68 @@ def update_statistics(profile_data: Dict) -> Dict:
     stats = profile_data["stats"]
     stats["total_meals_tracked"] = len(meals)
 
-    # Calculate average calories
-    total_calories = sum(meal.get("calories", 0) for meal in meals)
+    # Single pass over the history for calories, visits and ratings
+    total_calories = 0
+    rating_total = rating_count = 0
+    visits = Counter()
+    for meal in meals:
+        total_calories += meal.get("calories", 0)
+        restaurant = meal.get("restaurant")
+        if restaurant:
+            visits[restaurant] += 1
+        rating = meal.get("rating")
+        if rating:
+            rating_total += rating
+            rating_count += 1
+
     stats["avg_daily_calories"] = round(total_calories / len(meals), 1)
 
-    # Find most visited restaurant
-    restaurants = [meal.get("restaurant") for meal in meals if meal.get("restaurant")]
-    if restaurants:
-        stats["most_visited_restaurant"] = max(
-            set(restaurants), key=restaurants.count
-        )
+    # Running sums let add_meal_to_history update the averages without a rescan
+    stats["calories_total"] = total_calories
+    stats["ratings_total"] = rating_total
+    stats["ratings_count"] = rating_count
+
+    if visits:
+        stats["most_visited_restaurant"] = visits.most_common(1)[0][0]
 
-    # Calculate average rating
-    ratings = [meal.get("rating") for meal in meals if meal.get("rating")]
-    if ratings:
-        stats["avg_meal_rating"] = round(sum(ratings) / len(ratings), 1)
+    if rating_count:
+        stats["avg_meal_rating"] = round(rating_total / rating_count, 1)
 
     return profile_data
 
 
+def _profile_day_cache(func):
+    """
+    Memoize a meal-history lookup on the profile for the current day.
+
+    Results live in profile_data["_cached"] keyed by function, date, history
+    length and arguments, and expire after MEAL_CACHE_TTL_SECONDS.
+    add_meal_to_history clears them through invalidate_profile_cache.
+    """
+    @wraps(func)
+    def wrapper(profile_data: Dict, *args, **kwargs):
+        key = (
+            func.__name__,
+            date.today().toordinal(),
+            len(profile_data["meal_history"]),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        cached = profile_data.setdefault(CACHE_KEY, {})
+        now = time.monotonic()
+
+        entry = cached.get(key)
+        if entry is not None and now - entry[0] < MEAL_CACHE_TTL_SECONDS:
+            return entry[1]
+
+        result = func(profile_data, *args, **kwargs)
+        cached[key] = (now, result)
+        return result
+
+    return wrapper
+
+
+@_profile_day_cache
 def get_todays_meals(profile_data: Dict) -> List[Dict]:
     """
     Get meals logged today.
@@ -359,33 +618,57 @@ def get_todays_meals(profile_data: Dict) -> List[Dict]:
         List of today's meals
     """
     today = datetime.now().date()
-    todays_meals = []
+    return [
+        meal
+        for meal, meal_date in zip(profile_data["meal_history"], _meal_dates(profile_data))
+        if meal_date == today
+    ]
+
 
-    for meal in profile_data["meal_history"]:
-        meal_date_str = meal.get("timestamp", "")
-        if meal_date_str:
+def _meal_dates(profile_data: Dict) -> List[Optional[date]]:
+    """
+    Get the date of each meal in the history, parsed once per history change.
+
+    Memoized under profile_data["_cached"] alongside the history it was
+    parsed from; meals without a valid timestamp map to None.
+    """
+    meals = profile_data["meal_history"]
+    cached = profile_data.setdefault(CACHE_KEY, {})
+    dates = cached.get("meal_dates")
+
+    # add_meal_to_history invalidates the cache; the length check covers
+    # the trim that follows within the same call
+    if dates is None or len(dates) != len(meals):
+        dates = []
+        for meal in meals:
             try:
-                meal_date = datetime.fromisoformat(meal_date_str).date()
-                if meal_date == today:
-                    todays_meals.append(meal)
-            except ValueError:
-                continue
+                dates.append(datetime.fromisoformat(meal.get("timestamp", "")).date())
+            except (TypeError, ValueError):
+                dates.append(None)
+        cached["meal_dates"] = dates
 
-    return todays_meals
+    return dates
 
 
-def get_recent_meals(profile_data: Dict, count: int = 10) -> List[Dict]:
+@_profile_day_cache
+def get_recent_meals(
+    profile_data: Dict, count: int = 10, newest_first: bool = False
+) -> List[Dict]:
     """
     Get the most recent meals.
 
     Args:
         profile_data: User profile dictionary
         count: Number of recent meals to return
+        newest_first: Return the latest meal first instead of chronological order
 
     Returns:
         List of recent meals
     """
     meals = profile_data["meal_history"]
+    if newest_first:
+        # Single reversed slice of the tail; no copy of the full history
+        return meals[: -count - 1 : -1]
     return meals[-count:] if len(meals) > count else meals
 
 
@@ -427,38 +710,18 @@ def export_meal_history_csv(profile_data: Dict, output_file: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        import csv
-
         meals = profile_data["meal_history"]
 
         if not meals:
             return False
 
         with open(output_file, "w", newline="") as f:
-            fieldnames = [
-                "timestamp",
-                "restaurant",
-                "calories",
-                "protein",
-                "sodium",
-                "rating",
-                "notes",
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for meal in meals:
-                writer.writerow(
-                    {
-                        "timestamp": meal.get("timestamp", ""),
-                        "restaurant": meal.get("restaurant", ""),
-                        "calories": meal.get("calories", ""),
-                        "protein": meal.get("protein", ""),
-                        "sodium": meal.get("sodium", ""),
-                        "rating": meal.get("rating", ""),
-                        "notes": meal.get("notes", ""),
-                    }
-                )
+            writer = csv.writer(f)
+            writer.writerow(MEAL_CSV_FIELDS)
+            writer.writerows(
+                tuple(meal.get(field, "") for field in MEAL_CSV_FIELDS)
+                for meal in meals
+            )
 
         return True
     except Exception as e:
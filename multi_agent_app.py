@@ -7,60 +7,54 @@ This Streamlit application uses a multi-agent system with specialized agents:
 - Restaurant Expert: Provides menu recommendations
 """
 
-import asyncio
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 import streamlit as st
-from agents import set_default_openai_key
+from agents import set_default_openai_client
 from dotenv import load_dotenv
+from openai import AsyncOpenAI
 
 from multi_agents.coordinator import run_multi_agent_workflow
-from memory.user_profile import (
-    add_meal_to_history,
-    create_default_profile,
-    get_profile_summary,
-    get_recent_meals,
-    list_profiles,
-    load_profile,
-    save_profile,
-)
+from memory.user_profile import add_meal_to_history, get_recent_meals
+from ui.sidebar import format_user_goal, render_sidebar, save_profile_and_refresh
 
 # Import production features
+from core.async_runner import run_async
 from core.health_endpoint import render_health_dashboard, render_cost_dashboard
 from middleware.security import sanitize_user_inputs
 from middleware.error_handler import SafetyWrapper
 from config.cost_control import can_make_api_request
 
 
-def format_user_goal(
-    restaurant: str,
-    calories: int,
-    dietary_restrictions: List[str],
-    additional_notes: str,
-) -> str:
-    """Format user inputs into a natural language goal."""
-    if not restaurant.strip():
-        raise ValueError("Restaurant name cannot be empty")
-
-    if dietary_restrictions:
-        if len(dietary_restrictions) == 1:
-            restrictions_text = (
-                f"I have dietary restrictions: {dietary_restrictions[0]}"
-            )
-        else:
-            restrictions_text = (
-                f"I have dietary restrictions: {', '.join(dietary_restrictions)}"
-            )
-    else:
-        restrictions_text = "I have no dietary restrictions"
+@st.cache_resource(show_spinner=False)
+def _load_prompt(path: str) -> str:
+    """Read a prompt file once per process; the string is shared, not copied, on reruns."""
+    with open(path, "r") as file:
+        return file.read()
+
+
+# Seconds to wait for the agents before giving up on a request
+AGENT_TIMEOUT_SECONDS = 120
+
 
-    user_goal = f"I want a {calories} calorie meal from {restaurant.lower()}. {restrictions_text}."
+@st.cache_resource(show_spinner=False)
+def _bootstrap() -> bool:
+    """
+    Load .env and configure the agents library once per process.
 
-    if additional_notes.strip():
-        user_goal += f" Additional preferences: {additional_notes.strip()}."
+    Installs one shared AsyncOpenAI client so every agent run reuses the same
+    HTTP connection pool on the background event loop.
 
-    return user_goal
+    Returns:
+        True if an OpenAI API key was found and set, False otherwise
+    """
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return False
+    set_default_openai_client(AsyncOpenAI(api_key=api_key))
+    return True
 
 
 def generate_multi_agent_recommendations(
@@ -93,8 +87,9 @@ def generate_multi_agent_recommendations(
         with SafetyWrapper(error_type="api_error") as safety:
             try:
                 # Run multi-agent workflow
-                recommendations, session_context = asyncio.run(
-                    run_multi_agent_workflow(user_goal, user_profile)
+                recommendations, session_context = run_async(
+                    run_multi_agent_workflow(user_goal, user_profile),
+                    timeout=AGENT_TIMEOUT_SECONDS,
                 )
 
                 # Store in session state
@@ -138,21 +133,14 @@ def generate_multi_agent_recommendations(
             st.error(safety.error_message)
 
 
-# Load environment variables
-load_dotenv()
-set_default_openai_key(os.environ.get("OPENAI_API_KEY", ""))
+# Load environment variables and set the OpenAI key (once per process)
+_bootstrap()
 
 # Configure Streamlit page
 st.set_page_config(
     page_title="Multi-Agent Nutrition System", page_icon="🤖", layout="wide"
 )
 
-# Initialize session state
-if "current_profile" not in st.session_state:
-    st.session_state.current_profile = None
-if "profile_name" not in st.session_state:
-    st.session_state.profile_name = None
-
 # Title and description
 st.title("🤖 Multi-Agent Fast Food Nutrition System")
 st.markdown("""
@@ -162,195 +150,8 @@ st.markdown("""
 - 🎯 **Coordinator Agent** combines insights for optimal recommendations
 """)
 
-# Sidebar: Profile Management
-st.sidebar.header("👤 Profile Management")
-
-available_profiles = list_profiles()
-profile_action = st.sidebar.radio(
-    "Profile Options:",
-    ["Use Existing Profile", "Create New Profile", "No Profile (Guest)"],
-)
-
-if profile_action == "Use Existing Profile":
-    if available_profiles:
-        selected_profile = st.sidebar.selectbox(
-            "Select Profile:", [""] + available_profiles
-        )
-
-        if selected_profile:
-            if (
-                st.session_state.profile_name != selected_profile
-                or st.session_state.current_profile is None
-            ):
-                st.session_state.current_profile = load_profile(selected_profile)
-                st.session_state.profile_name = selected_profile
-
-            if st.session_state.current_profile:
-                st.sidebar.success(f"✓ Loaded: {selected_profile}")
-                with st.sidebar.expander("📊 Profile Stats"):
-                    st.markdown(get_profile_summary(st.session_state.current_profile))
-    else:
-        st.sidebar.info("No profiles found. Create one below!")
-        profile_action = "Create New Profile"
-
-elif profile_action == "Create New Profile":
-    new_profile_name = st.sidebar.text_input(
-        "Profile Name:", placeholder="e.g., John, Work Diet, Keto Plan"
-    )
-
-    if st.sidebar.button("Create Profile"):
-        if new_profile_name:
-            new_profile = create_default_profile()
-            if save_profile(new_profile_name, new_profile):
-                st.session_state.current_profile = new_profile
-                st.session_state.profile_name = new_profile_name
-                st.sidebar.success(f"✓ Created profile: {new_profile_name}")
-                st.rerun()
-            else:
-                st.sidebar.error("Failed to create profile")
-        else:
-            st.sidebar.warning("Please enter a profile name")
-
-elif profile_action == "No Profile (Guest)":
-    st.session_state.current_profile = None
-    st.session_state.profile_name = None
-    st.sidebar.info("Using guest mode (no memory)")
-
-# Sidebar: Meal Preferences
-st.sidebar.markdown("---")
-st.sidebar.header("📋 Your Meal Preferences")
-
-restaurant_option = st.sidebar.radio(
-    "Restaurant:", ["Select from list", "Enter custom restaurant"]
-)
-
-default_restaurants = [
-    "Chick-fil-A",
-    "McDonald's",
-    "Subway",
-    "Taco Bell",
-    "Burger King",
-    "KFC",
-    "Pizza Hut",
-    "Domino's",
-]
-
-if st.session_state.current_profile:
-    fav_restaurants = st.session_state.current_profile["user_preferences"].get(
-        "favorite_restaurants", []
-    )
-    all_restaurants = fav_restaurants + [
-        r for r in default_restaurants if r not in fav_restaurants
-    ]
-else:
-    all_restaurants = default_restaurants
-
-if restaurant_option == "Select from list":
-    restaurant = st.sidebar.selectbox("Choose a restaurant:", all_restaurants)
-else:
-    restaurant = st.sidebar.text_input(
-        "Enter restaurant name:",
-        placeholder="e.g., Five Guys, Chipotle, Panera Bread...",
-    )
-
-# Calorie target
-default_calories = 1200
-if st.session_state.current_profile:
-    default_calories = st.session_state.current_profile["user_preferences"].get(
-        "default_calorie_target", 1200
-    )
-
-calories = st.sidebar.number_input(
-    "Target calories:", min_value=300, max_value=2000, value=default_calories, step=50
-)
-
-# Dietary restrictions
-restrictions_option = st.sidebar.radio(
-    "Dietary restrictions:", ["Select from list", "Enter custom restrictions"]
-)
-
-default_restrictions = []
-if st.session_state.current_profile:
-    default_restrictions = st.session_state.current_profile["user_preferences"].get(
-        "dietary_restrictions", []
-    )
-
-if restrictions_option == "Select from list":
-    restriction_options = [
-        "No restrictions",
-        "Gluten-free",
-        "Dairy-free",
-        "Vegetarian",
-        "Vegan",
-        "No pork",
-        "No beef",
-        "Low sodium",
-        "Low carb",
-        "Keto",
-    ]
-
-    valid_defaults = [r for r in default_restrictions if r in restriction_options]
-
-    dietary_restrictions = st.sidebar.multiselect(
-        "Choose restrictions (if any):",
-        restriction_options,
-        default=valid_defaults,
-    )
-else:
-    default_custom = ", ".join(default_restrictions) if default_restrictions else ""
-    custom_restrictions = st.sidebar.text_input(
-        "Enter your dietary restrictions:",
-        value=default_custom,
-        placeholder="e.g., no nuts, halal, kosher...",
-    )
-    dietary_restrictions = [custom_restrictions] if custom_restrictions else []
-
-# Additional notes
-default_notes = ""
-if st.session_state.current_profile:
-    prefs = st.session_state.current_profile["user_preferences"]
-    pref_methods = prefs.get("preferred_cooking_methods", [])
-    dislikes = prefs.get("disliked_items", [])
-
-    notes_parts = []
-    if pref_methods:
-        notes_parts.append(f"Prefer {', '.join(pref_methods)}")
-    if dislikes:
-        notes_parts.append(f"Dislike {', '.join(dislikes)}")
-    default_notes = "; ".join(notes_parts)
-
-additional_notes = st.sidebar.text_area(
-    "Additional preferences or notes:",
-    value=default_notes,
-    placeholder="e.g., prefer grilled over fried, need extra protein...",
-)
-
-# Save preferences button
-if st.session_state.current_profile and st.sidebar.button(
-    "💾 Save Current Preferences to Profile"
-):
-    st.session_state.current_profile["user_preferences"][
-        "default_calorie_target"
-    ] = calories
-    st.session_state.current_profile["user_preferences"][
-        "dietary_restrictions"
-    ] = dietary_restrictions
-
-    if (
-        restaurant
-        and restaurant
-        not in st.session_state.current_profile["user_preferences"][
-            "favorite_restaurants"
-        ]
-    ):
-        st.session_state.current_profile["user_preferences"][
-            "favorite_restaurants"
-        ].append(restaurant)
-
-    if save_profile(st.session_state.profile_name, st.session_state.current_profile):
-        st.sidebar.success("✓ Preferences saved!")
-    else:
-        st.sidebar.error("Failed to save preferences")
+# Profile management and meal preferences live in the shared sidebar
+meal_request = render_sidebar()
 
 # Production Monitoring - Add health and cost dashboards to sidebar
 st.sidebar.markdown("---")
@@ -363,23 +164,15 @@ col1, col2 = st.columns([2, 1])
 with col1:
     st.header("🎯 Your Meal Request")
 
-    try:
-        user_goal = format_user_goal(
-            restaurant, calories, dietary_restrictions, additional_notes
-        )
-        st.info(f"**Your request:** {user_goal}")
-
-    except ValueError as e:
-        st.warning(f"⚠️ {str(e)}")
-        st.stop()
-
     # Display meal history
     if st.session_state.current_profile:
-        recent_meals = get_recent_meals(st.session_state.current_profile, count=10)
+        recent_meals = get_recent_meals(
+            st.session_state.current_profile, count=10, newest_first=True
+        )
         if recent_meals:
             with st.expander("📜 Recent Meal History (Last 10)", expanded=False):
                 st.markdown("### Your Recent Orders")
-                for i, meal in enumerate(reversed(recent_meals), 1):
+                for i, meal in enumerate(recent_meals, 1):
                     rating_display = (
                         "⭐" * meal.get("rating", 0)
                         if meal.get("rating")
@@ -390,15 +183,28 @@ with col1:
                         f"{meal.get('calories', 'N/A')} cal - {rating_display}"
                     )
 
-    # Main action button
-    if st.button(
-        "🤖 Get Multi-Agent Recommendations", type="primary", use_container_width=True
-    ):
-        st.session_state.meal_logged = False
-        generate_multi_agent_recommendations(
-            user_goal, restaurant, calories, st.session_state.current_profile
+    # Main action button; the request is only built when the form is submitted
+    with st.form("meal_request", border=False):
+        st.caption("Set your preferences in the sidebar, then request recommendations.")
+        submitted = st.form_submit_button(
+            "🤖 Get Multi-Agent Recommendations", type="primary", use_container_width=True
         )
 
+    if submitted:
+        try:
+            user_goal = format_user_goal(meal_request)
+        except ValueError as e:
+            st.warning(f"⚠️ {str(e)}")
+        else:
+            st.info(f"**Your request:** {user_goal}")
+            st.session_state.meal_logged = False
+            generate_multi_agent_recommendations(
+                user_goal,
+                meal_request.restaurant,
+                meal_request.calories,
+                st.session_state.current_profile,
+            )
+
     # Display previous recommendations
     if st.session_state.get("show_recommendations"):
         if st.button("🗑️ Clear Recommendations"):
@@ -415,38 +221,41 @@ with col1:
         st.subheader("📊 Log This Meal")
         st.markdown("Help improve future recommendations by rating this meal!")
 
-        col_rate1, col_rate2 = st.columns(2)
-
-        with col_rate1:
-            meal_rating = st.select_slider(
-                "How satisfied were you?",
-                options=[1, 2, 3, 4, 5],
-                value=3,
-                help="1 = Not satisfied, 5 = Very satisfied",
-                key="meal_rating_slider",
-            )
+        with st.form("log_meal"):
+            col_rate1, col_rate2 = st.columns(2)
 
-        with col_rate2:
-            if st.button("💾 Log Meal to History", use_container_width=True):
-                meal_entry = {
-                    "restaurant": st.session_state.get("last_restaurant", restaurant),
-                    "calories": st.session_state.get("last_calories", calories),
-                    "rating": meal_rating,
-                }
+            with col_rate1:
+                meal_rating = st.select_slider(
+                    "How satisfied were you?",
+                    options=[1, 2, 3, 4, 5],
+                    value=3,
+                    help="1 = Not satisfied, 5 = Very satisfied",
+                    key="meal_rating_slider",
+                )
 
-                updated_profile = add_meal_to_history(
-                    st.session_state.current_profile, meal_entry
+            with col_rate2:
+                log_submitted = st.form_submit_button(
+                    "💾 Log Meal to History", use_container_width=True
                 )
 
-                if save_profile(st.session_state.profile_name, updated_profile):
-                    st.session_state.current_profile = load_profile(
-                        st.session_state.profile_name
-                    )
-                    st.session_state.meal_logged = True
-                    st.success("✓ Meal logged successfully!")
-                    st.rerun()
-                else:
-                    st.error("Failed to log meal")
+        if log_submitted:
+            meal_entry = {
+                "restaurant": st.session_state.get("last_restaurant", meal_request.restaurant),
+                "calories": st.session_state.get("last_calories", meal_request.calories),
+                "rating": meal_rating,
+            }
+
+            updated_profile = add_meal_to_history(
+                st.session_state.current_profile, meal_entry
+            )
+
+            if save_profile_and_refresh(st.session_state.profile_name, updated_profile):
+                st.session_state.current_profile = updated_profile
+                st.session_state.meal_logged = True
+                st.success("✓ Meal logged successfully!")
+                st.rerun()
+            else:
+                st.error("Failed to log meal")
 
 with col2:
     st.header("🤖 Multi-Agent System")
@@ -496,13 +305,14 @@ with col2:
             if st.button("🔍 Get Profile Insights", use_container_width=True):
                 with st.spinner("Analyzing your preferences..."):
                     from multi_agents.profile_manager_agent import ProfileManagerAgent
-                    import asyncio
                     
-                    with open("prompts/profile_manager_prompt.txt", "r") as f:
-                        pm_prompt = f.read()
+                    pm_prompt = _load_prompt("prompts/profile_manager_prompt.txt")
                     
                     pm_agent = ProfileManagerAgent(pm_prompt)
-                    insights = asyncio.run(pm_agent.analyze_profile(st.session_state.current_profile))
+                    insights = run_async(
+                        pm_agent.analyze_profile(st.session_state.current_profile),
+                        timeout=AGENT_TIMEOUT_SECONDS,
+                    )
                     
                     st.session_state.profile_insights = insights
                     st.rerun()
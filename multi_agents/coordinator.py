@@ -287,7 +287,7 @@ Please combine these analyses into a cohesive, user-friendly response. Include:
         """
         try:
             # Use the original single-agent approach
-            from agent import run_nutrition_agent, get_task_generator
+            from archive.agent_v1 import run_nutrition_agent, get_task_generator
 
             with open("prompts/agent_prompt.txt", "r") as f:
                 prompt = f.read()
@@ -59,15 +59,18 @@ class NutritionistAgent:
         Returns:
             Formatted request with context
         """
-        request = f"## User Request\n{user_goal}\n\n"
+        # Most stable context first and the per-request goal last, so
+        # consecutive requests share the longest possible cached prefix
+        request = ""
+
+        if user_profile:
+            request += self._add_profile_context(user_profile) + "\n"
 
         if profile_insights:
             request += f"## Profile Insights\n{profile_insights}\n\n"
 
-        if user_profile:
-            request += self._add_profile_context(user_profile)
-
-        request += "\nProvide a detailed nutritional analysis for this request."
+        request += f"## User Request\n{user_goal}\n\n"
+        request += "Provide a detailed nutritional analysis for this request."
         return request
 
     def _add_profile_context(self, user_profile: Dict) -> str:
@@ -99,12 +102,11 @@ class NutritionistAgent:
                 context += f"**Average Rating**: {stats['avg_meal_rating']}/5 ⭐\n"
 
         # Add today's meals context
-        from memory.user_profile import get_todays_meals
+        from memory.user_profile import get_todays_totals
 
-        todays_meals = get_todays_meals(user_profile)
-        if todays_meals:
-            total_today = sum(m.get("calories", 0) for m in todays_meals)
-            context += f"\n**⚠️ Today's Intake**: {len(todays_meals)} meal(s), {total_today} calories already logged\n"
+        meals_today, total_today = get_todays_totals(user_profile)
+        if meals_today:
+            context += f"\n**⚠️ Today's Intake**: {meals_today} meal(s), {total_today} calories already logged\n"
 
         # Add recent meal patterns
         meal_history = user_profile.get("meal_history", [])
@@ -71,17 +71,19 @@ class RestaurantAgent:
         Returns:
             Formatted request with context
         """
-        request = f"## User Request\n{user_goal}\n\n"
-        
-        if profile_insights:
-            request += f"## Profile Insights (from Profile Manager)\n{profile_insights}\n\n"
-        
-        request += f"## Nutritional Guidance\n{nutritional_analysis}\n\n"
+        # Most stable context first and the per-request goal last, so
+        # consecutive requests share the longest possible cached prefix
+        request = ""
 
         if user_profile:
-            request += self._add_preference_context(user_profile)
+            request += self._add_preference_context(user_profile) + "\n"
 
-        request += "\nProvide 2-3 specific menu recommendations with exact items and nutritional breakdowns."
+        if profile_insights:
+            request += f"## Profile Insights (from Profile Manager)\n{profile_insights}\n\n"
+
+        request += f"## Nutritional Guidance\n{nutritional_analysis}\n\n"
+        request += f"## User Request\n{user_goal}\n\n"
+        request += "Provide 2-3 specific menu recommendations with exact items and nutritional breakdowns."
         return request
 
     def _add_preference_context(self, user_profile: Dict) -> str:
@@ -0,0 +1,37 @@
+"""
+Tests for the single-agent user context block.
+"""
+
+import pytest
+from archive.agent_v1 import build_user_context
+from memory.user_profile import create_default_profile, get_recent_meals, get_todays_meals
+
+
+class TestBuildUserContext:
+    """Test USER CONTEXT rendering."""
+    
+    def test_new_profile_adds_no_context(self):
+        """Test a brand-new profile contributes nothing to the request."""
+        assert build_user_context(create_default_profile()) == ""
+    
+    def test_new_profile_adds_no_context_after_meal_lookups(self):
+        """Test memoized meal lookups don't make an empty profile look populated."""
+        profile = create_default_profile()
+        get_todays_meals(profile)
+        get_recent_meals(profile, count=5)
+        
+        assert build_user_context(profile) == ""
+    
+    def test_out_of_range_ratings_render_as_not_rated(self, sample_profile):
+        """Test bad ratings from hand-edited profiles are clamped instead of failing."""
+        sample_profile["meal_history"] += [
+            {"restaurant": "KFC", "calories": 500, "rating": 9},
+            {"restaurant": "KFC", "calories": 500, "rating": -1},
+            {"restaurant": "KFC", "calories": 500, "rating": "great"},
+        ]
+        
+        context = build_user_context(sample_profile)
+        
+        # 9 clamps to five stars; negative and non-numeric ratings are unrated
+        assert "KFC - 500 cal - ⭐⭐⭐⭐⭐" in context
+        assert context.count("Not rated") == 2
@@ -0,0 +1,86 @@
+"""
+Tests for the background event loop runner.
+"""
+
+import asyncio
+import threading
+import pytest
+from core.async_runner import BackgroundLoop
+
+
+class TestBackgroundLoop:
+    """Test background loop behaviour."""
+    
+    def test_run_returns_result(self):
+        """Test coroutines run to completion and return their result."""
+        runner = BackgroundLoop()
+        
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+        
+        assert runner.run(add(2, 3)) == 5
+    
+    def test_loop_is_reused(self):
+        """Test successive calls share one loop on one thread."""
+        runner = BackgroundLoop()
+        
+        async def current():
+            return asyncio.get_running_loop(), threading.current_thread()
+        
+        first = runner.run(current())
+        second = runner.run(current())
+        
+        assert first == second
+        assert first[1] is not threading.current_thread()
+    
+    def test_iterate_async_generator(self):
+        """Test async generators can be consumed from sync code."""
+        runner = BackgroundLoop()
+        
+        async def chunks():
+            for chunk in ("a", "b", "c"):
+                await asyncio.sleep(0)
+                yield chunk
+        
+        assert list(runner.iterate(chunks())) == ["a", "b", "c"]
+    
+    def test_run_timeout_cancels_coroutine(self):
+        """Test a timed-out coroutine is cancelled on the loop."""
+        runner = BackgroundLoop()
+        cancelled = []
+        
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        with pytest.raises(TimeoutError):
+            runner.run(slow(), timeout=0.05)
+        
+        runner.run(asyncio.sleep(0.05))
+        assert cancelled == [True]
+    
+    def test_iterate_closes_generator_when_consumer_stops(self):
+        """Test abandoning iteration closes the async generator on the loop."""
+        runner = BackgroundLoop()
+        closed = []
+        
+        async def endless():
+            try:
+                while True:
+                    await asyncio.sleep(0)
+                    yield "chunk"
+            finally:
+                closed.append(True)
+        
+        # Keep a reference so garbage collection can't be what closes it
+        agen = endless()
+        stream = runner.iterate(agen)
+        assert next(stream) == "chunk"
+        stream.close()
+        
+        runner.run(asyncio.sleep(0.05))
+        assert closed == [True]
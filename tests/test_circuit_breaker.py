@@ -0,0 +1,79 @@
+"""
+Tests for the circuit breaker.
+"""
+
+import pytest
+from core.circuit_breaker import CircuitBreaker, CircuitBreakerError
+
+
+def failing():
+    """Raise to simulate a failing service call."""
+    raise RuntimeError("service down")
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions."""
+    
+    def test_opens_after_failure_threshold(self):
+        """Test the circuit opens and blocks calls once failures pile up."""
+        breaker = CircuitBreaker(failure_threshold=2, name="test")
+        
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                breaker.call(failing)
+        
+        assert breaker.get_status()["state"] == "open"
+        with pytest.raises(CircuitBreakerError):
+            breaker.call(lambda: "ok")
+    
+    def test_late_failures_do_not_reopen(self):
+        """Test failures from calls in flight when the circuit opened don't re-trip it."""
+        breaker = CircuitBreaker(failure_threshold=1, name="test")
+        with pytest.raises(RuntimeError):
+            breaker.call(failing)
+        opened_at = breaker.last_state_change
+        failed_at = breaker.last_failure_time
+        
+        breaker._on_failure()
+        
+        assert breaker.last_state_change == opened_at
+        assert breaker.last_failure_time == failed_at
+        assert breaker.get_status()["state"] == "open"
+    
+    def test_recovers_after_timeout(self):
+        """Test the circuit half-opens after the timeout and closes on success."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=60, success_threshold=1, name="test"
+        )
+        with pytest.raises(RuntimeError):
+            breaker.call(failing)
+        
+        # Pretend the failure happened before the recovery timeout
+        breaker.last_failure_time -= 61
+        
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.get_status()["state"] == "closed"
+    
+    def test_status_cached_until_breaker_changes(self):
+        """Test get_status reuses its dict until a call changes the breaker."""
+        breaker = CircuitBreaker(name="test")
+        status = breaker.get_status()
+        
+        assert breaker.get_status() is status
+        
+        with pytest.raises(RuntimeError):
+            breaker.call(failing)
+        assert breaker.get_status() is not status
+        assert breaker.get_status()["failure_count"] == 1
+    
+    def test_status_timestamps_are_iso_strings(self):
+        """Test status serializes timestamps for the health dashboard."""
+        breaker = CircuitBreaker(name="test")
+        status = breaker.get_status()
+        
+        assert status["last_failure"] is None
+        assert isinstance(status["last_state_change"], str)
+        
+        with pytest.raises(RuntimeError):
+            breaker.call(failing)
+        assert isinstance(breaker.get_status()["last_failure"], str)
@@ -2,8 +2,10 @@
 Tests for cost control and rate limiting.
 """
 
+import time
 import pytest
 from datetime import datetime, timedelta
+from config import cost_control
 from config.cost_control import CostController, can_make_api_request, get_usage_stats
 
 
@@ -48,6 +50,36 @@ class TestCostController:
         assert can_request is False
         assert "budget" in reason.lower()
     
+    def test_can_make_request_fast_path_skips_checks(self):
+        """Test usage far below the limits is admitted from cached totals."""
+        controller = CostController()
+        controller.get_daily_usage()
+        controller.get_monthly_usage()
+        
+        def fail_check():
+            raise AssertionError("full checks should be skipped")
+        
+        controller._check_rate_limit = fail_check
+        
+        assert controller.can_make_request(0.001) == (True, "")
+    
+    def test_can_make_request_fast_path_respects_cache_ttl(self):
+        """Test expired cached totals fall through to the full checks."""
+        controller = CostController()
+        controller.get_daily_usage()
+        controller.get_monthly_usage()
+        controller._daily_loaded_at -= cost_control.USAGE_CACHE_TTL_SECONDS
+        checks = []
+        
+        def record_check():
+            checks.append("rate_limit")
+            return True
+        
+        controller._check_rate_limit = record_check
+        
+        assert controller.can_make_request(0.001) == (True, "")
+        assert checks == ["rate_limit"]
+    
     def test_log_usage(self):
         """Test usage logging."""
         controller = CostController()
@@ -77,6 +109,160 @@ class TestCostController:
         assert "daily_limit" in summary
         assert "monthly_usage" in summary
         assert summary["daily_usage"] >= 0
+    
+    def test_log_usage_updates_cached_totals(self):
+        """Test logged costs are added to the cached totals without a reload."""
+        controller = CostController()
+        assert controller.get_daily_usage() == 0
+        assert controller.get_monthly_usage() == 0
+        
+        loads = []
+        controller._load_daily_usage = lambda: loads.append("daily") or 0.0
+        controller._load_monthly_usage = lambda: loads.append("monthly") or 0.0
+        
+        controller.log_usage("gpt-4", 1000, 500, success=True)
+        
+        assert abs(controller.get_daily_usage() - 0.06) < 1e-9
+        assert abs(controller.get_monthly_usage() - 0.06) < 1e-9
+        assert loads == []
+    
+    def test_reload_keeps_costs_not_yet_flushed(self):
+        """Test a TTL reload adds rows still waiting for the flusher."""
+        controller = CostController()
+        controller.get_daily_usage()
+        
+        # Logged but not yet inserted, so the database sum doesn't include it
+        controller._pending_rows = [{"estimated_cost": 0.06}]
+        controller._pending_cost = 0.06
+        controller._load_daily_usage = lambda: 0.0
+        controller._daily_loaded_at -= cost_control.USAGE_CACHE_TTL_SECONDS
+        
+        assert abs(controller.get_daily_usage() - 0.06) < 1e-9
+    
+    def test_limit_warning_does_not_reload_totals(self):
+        """Test the post-log warning reads the running total instead of reloading."""
+        controller = CostController()
+        controller._redis = None
+        controller.get_daily_usage()
+        controller._daily_loaded_at -= cost_control.USAGE_CACHE_TTL_SECONDS
+        
+        loads = []
+        controller._load_daily_usage = lambda: loads.append("daily") or 0.0
+        
+        controller._after_log_usage(time.time())
+        
+        assert loads == []
+    
+    def test_limit_warning_ignores_previous_day_total(self, monkeypatch):
+        """Test a total cached for an earlier day does not trigger the warning."""
+        controller = CostController()
+        controller._redis = None
+        controller._daily_total = controller.daily_limit
+        controller._daily_bucket = controller._today_start - 86400
+        
+        warnings = []
+        monkeypatch.setattr(cost_control.logger, "warning", warnings.append)
+        
+        controller._after_log_usage(time.time())
+        
+        assert warnings == []
+    
+    def test_failed_reload_does_not_double_count_pending_rows(self, monkeypatch):
+        """Test a failing usage query falls back to memory without re-adding pending rows."""
+        class FailingTable:
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self
+            
+            def execute(self):
+                raise RuntimeError("select failed")
+        
+        class FakeClient:
+            def table(self, name):
+                return FailingTable()
+        
+        monkeypatch.setattr(cost_control, "is_database_available", lambda: True)
+        monkeypatch.setattr(cost_control, "get_supabase_client", lambda: FakeClient())
+        controller = CostController()
+        controller._flusher = object()  # keep the background flusher from starting
+        
+        controller.log_usage("gpt-4", 1000, 500, success=True)
+        
+        assert abs(controller._pending_cost - 0.06) < 1e-9
+        assert abs(controller.get_daily_usage() - 0.06) < 1e-9
+        assert abs(controller.get_monthly_usage() - 0.06) < 1e-9
+    
+    def test_rate_limit_expires_old_requests(self):
+        """Test requests older than an hour no longer count toward the limit."""
+        controller = CostController()
+        controller._redis = None
+        controller.hourly_request_limit = 1
+        controller._in_memory_usage["requests"].append(time.time() - 7200)
+        
+        assert controller._check_rate_limit() is True
+        assert len(controller._in_memory_usage["requests"]) == 0
+    
+    def test_in_memory_usage_drops_previous_months(self):
+        """Test the in-memory fallback only counts costs in the current window."""
+        controller = CostController()
+        now = datetime.now()
+        costs = controller._in_memory_usage["costs"]
+        costs.append(((now - timedelta(days=40)).timestamp(), 1.0))
+        costs.append((now.timestamp(), 0.25))
+        
+        controller._refresh_boundaries(time.time())
+        
+        assert controller.get_daily_usage() == 0.25
+        assert controller.get_monthly_usage() == 0.25
+        assert len(costs) == 1
+    
+    def test_flush_inserts_buffered_rows_in_one_batch(self, monkeypatch):
+        """Test buffered usage rows are written with a single insert."""
+        inserted = []
+        
+        class FakeTable:
+            def insert(self, rows):
+                inserted.append(rows)
+                return self
+            
+            def execute(self):
+                return None
+        
+        class FakeClient:
+            def table(self, name):
+                return FakeTable()
+        
+        monkeypatch.setattr(cost_control, "get_supabase_client", lambda: FakeClient())
+        controller = CostController()
+        controller._pending_rows = [{"model": "gpt-4"}, {"model": "gpt-3.5-turbo"}]
+        
+        controller.flush()
+        controller.flush()
+        
+        assert inserted == [[{"model": "gpt-4"}, {"model": "gpt-3.5-turbo"}]]
+        assert controller._pending_rows == []
+    
+    def test_failed_flush_requeues_rows(self, monkeypatch):
+        """Test rows from a failed insert go back to the front of the buffer."""
+        class FailingTable:
+            def insert(self, rows):
+                return self
+            
+            def execute(self):
+                raise RuntimeError("insert failed")
+        
+        class FakeClient:
+            def table(self, name):
+                return FailingTable()
+        
+        monkeypatch.setattr(cost_control, "get_supabase_client", lambda: FakeClient())
+        controller = CostController()
+        controller._pending_rows = [{"model": "gpt-4", "estimated_cost": 0.06}]
+        controller._pending_cost = 0.06
+        
+        controller.flush()
+        
+        assert controller._pending_rows == [{"model": "gpt-4", "estimated_cost": 0.06}]
+        assert abs(controller._pending_cost - 0.06) < 1e-9
 
 
 def test_can_make_api_request():
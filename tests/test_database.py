@@ -24,7 +24,7 @@ class TestDatabaseConfig:
         config = DatabaseConfig()
         assert config.use_database is False
     
-    @patch('config.database.create_client')
+    @patch('supabase.create_client')
     def test_database_health_check_success(self, mock_create_client):
         """Test successful database health check."""
         mock_client = Mock()
@@ -37,7 +37,7 @@ class TestDatabaseConfig:
         
         assert config.health_check() is True
     
-    @patch('config.database.create_client')
+    @patch('supabase.create_client')
     def test_database_health_check_failure(self, mock_create_client):
         """Test failed database health check."""
         mock_client = Mock()
@@ -49,6 +49,24 @@ class TestDatabaseConfig:
         config._client = mock_client
         
         assert config.health_check() is False
+    
+    @patch('supabase.create_client')
+    def test_is_available_memoized_until_invalidated(self, mock_create_client):
+        """Test availability is computed once and cleared by invalidate."""
+        mock_create_client.return_value = Mock()
+        
+        config = DatabaseConfig()
+        config.use_database = True
+        config.supabase_url = 'https://test.supabase.co'
+        config.supabase_key = 'test-key'
+        
+        assert config.is_available() is True
+        assert config.is_available() is True
+        assert mock_create_client.call_count == 1
+        
+        config.invalidate()
+        assert config.is_available() is False
+        assert config.client is None
 
 
 def test_get_supabase_client():
@@ -3,8 +3,11 @@ Tests for environment configuration.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 from config.environments import (
+    DAILY_COST_LIMIT,
+    HOURLY_REQUEST_LIMIT,
     Environment,
     EnvironmentConfig,
     get_environment,
@@ -67,6 +70,14 @@ class TestEnvironmentConfig:
         config = EnvironmentConfig()
         result = config.is_development()
         assert isinstance(result, bool)
+    
+    def test_config_is_immutable(self):
+        """Test settings cannot be changed after load and unknown keys use the default."""
+        config = EnvironmentConfig()
+        
+        with pytest.raises(FrozenInstanceError):
+            config.config.daily_cost_limit = 100.0
+        assert config.get("missing_key", "fallback") == "fallback"
 
 
 def test_get_environment():
@@ -86,3 +97,8 @@ def test_is_production_function():
     result = is_production()
     assert isinstance(result, bool)
 
+
+def test_resolved_constants_match_config():
+    """Test module-level settings mirror the active environment config."""
+    assert DAILY_COST_LIMIT == get_config("daily_cost_limit")
+    assert HOURLY_REQUEST_LIMIT == get_config("request_limit_per_hour")
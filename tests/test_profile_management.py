@@ -11,6 +11,11 @@ from memory.user_profile import (
     update_statistics,
     get_recent_meals,
     get_profile_summary,
+    get_todays_totals,
+    get_preference_csvs,
+    get_todays_meals,
+    invalidate_profile_cache,
+    export_meal_history_csv,
 )
 
 
@@ -72,6 +77,16 @@ class TestProfileManagement:
         assert len(recent) == 1
         assert recent[0]["restaurant"] == "Subway"
     
+    def test_get_recent_meals_newest_first(self):
+        """Test recent meals can be returned latest first."""
+        profile = create_default_profile()
+        for i in range(5):
+            add_meal_to_history(profile, {"restaurant": f"R{i}", "calories": 500})
+        
+        recent = get_recent_meals(profile, count=3, newest_first=True)
+        
+        assert [m["restaurant"] for m in recent] == ["R4", "R3", "R2"]
+    
     def test_get_profile_summary(self, sample_profile):
         """Test profile summary generation."""
         summary = get_profile_summary(sample_profile)
@@ -91,3 +106,132 @@ class TestProfileManagement:
         summary = get_profile_summary(profile)
         assert "0" in summary or "None" in summary
 
+    
+    def test_todays_totals_tracked_on_meal_log(self, sample_profile, sample_meal):
+        """Test today's meal count and calories are kept as running totals."""
+        updated_profile = add_meal_to_history(sample_profile, sample_meal)
+        
+        # Fixture meal (1200 cal) and new meal (800 cal) are both from today
+        assert get_todays_totals(updated_profile) == (2, 2000)
+        assert updated_profile["stats"]["calories_today"] == 2000
+    
+    def test_incremental_statistics_match_full_recompute(self):
+        """Test running stats stay equal to a rescan as meals are added and evicted."""
+        profile = create_default_profile()
+        for i in range(40):
+            meal = {
+                "restaurant": ["Subway", "KFC", "Taco Bell"][i % 3 if i < 20 else 1],
+                "calories": 500 + i * 10,
+                "rating": i % 5 or None,
+            }
+            profile = add_meal_to_history(profile, meal)
+        
+        incremental = dict(profile["stats"])
+        recomputed = update_statistics(profile)["stats"]
+        
+        for key in ("total_meals_tracked", "avg_daily_calories", "avg_meal_rating",
+                    "most_visited_restaurant", "calories_total", "ratings_count"):
+            assert incremental[key] == recomputed[key]
+        assert incremental["most_visited_restaurant"] == "KFC"
+    
+    def test_todays_meals_skip_invalid_timestamps(self, sample_profile):
+        """Test meals without a parseable timestamp are never counted as today's."""
+        sample_profile["meal_history"].append({"restaurant": "KFC", "calories": 500, "timestamp": "soon"})
+        sample_profile["meal_history"].append({"restaurant": "KFC", "calories": 500, "timestamp": None})
+        
+        assert [m["restaurant"] for m in get_todays_meals(sample_profile)] == ["Subway"]
+        assert sample_profile["_cached"]["meal_dates"][1:] == [None, None]
+    
+    def test_export_meal_history_csv(self, tmp_path, sample_profile):
+        """Test meals are exported with a header row and blanks for missing fields."""
+        output_file = tmp_path / "meals.csv"
+        
+        assert export_meal_history_csv(sample_profile, str(output_file)) is True
+        
+        header, row = output_file.read_text().splitlines()
+        assert header == "timestamp,restaurant,calories,protein,sodium,rating,notes"
+        assert row.split(",")[1:] == ["Subway", "1200", "", "", "4", ""]
+    
+    def test_todays_totals_without_running_stats(self, sample_profile):
+        """Test today's totals fall back to scanning history."""
+        assert get_todays_totals(sample_profile) == (1, 1200)
+    
+    def test_preference_csvs_cached_until_invalidated(self, sample_profile):
+        """Test joined preference lists are memoized on the profile."""
+        csvs = get_preference_csvs(sample_profile)
+        assert csvs["fav_restaurants_csv"] == ", ".join(
+            sample_profile["user_preferences"]["favorite_restaurants"][:3]
+        )
+        
+        sample_profile["user_preferences"]["dietary_restrictions"] = ["Vegan"]
+        assert get_preference_csvs(sample_profile)["restrictions_csv"] != "Vegan"
+        
+        invalidate_profile_cache(sample_profile)
+        assert get_preference_csvs(sample_profile)["restrictions_csv"] == "Vegan"
+    
+    def test_meal_lookups_refresh_after_logging(self):
+        """Test memoized meal lookups are invalidated when a meal is logged."""
+        profile = create_default_profile()
+        add_meal_to_history(profile, {"restaurant": "Subway", "calories": 600})
+        assert len(get_todays_meals(profile)) == 1
+        assert get_todays_meals(profile) is get_todays_meals(profile)
+        
+        add_meal_to_history(profile, {"restaurant": "Wendy's", "calories": 700})
+        
+        assert len(get_todays_meals(profile)) == 2
+        assert get_recent_meals(profile, count=1)[0]["restaurant"] == "Wendy's"
+    
+    def test_database_save_only_writes_changed_meals(self, monkeypatch, sample_profile):
+        """Test saving inserts new meals and deletes trimmed ones instead of rewriting all."""
+        import memory.user_profile as user_profile
+        
+        sample_profile["meal_history"][0]["id"] = "kept"
+        sample_profile = add_meal_to_history(sample_profile, {"restaurant": "KFC", "calories": 700})
+        new_id = sample_profile["meal_history"][-1]["id"]
+        calls = []
+        
+        class FakeQuery:
+            def __init__(self, name):
+                self.name = name
+                self.data = []
+            
+            def __getattr__(self, method):
+                def record(*args, **kwargs):
+                    calls.append((self.name, method, args))
+                    if (self.name, method) == ("user_profiles", "select"):
+                        self.data = [{"id": "profile-1"}]
+                    elif (self.name, method) == ("meal_history", "select"):
+                        self.data = [{"id": "kept"}, {"id": "trimmed"}]
+                    return self
+                return record
+            
+            def execute(self):
+                return self
+        
+        class FakeClient:
+            def table(self, name):
+                return FakeQuery(name)
+        
+        monkeypatch.setattr(user_profile, "get_supabase_client", lambda: FakeClient())
+        
+        assert user_profile._save_profile_to_database("alice", sample_profile)
+        
+        upserts = [args[0] for name, method, args in calls if method == "upsert"]
+        assert [[row["id"] for row in rows] for rows in upserts] == [[new_id]]
+        assert ("meal_history", "in_", ("id", ["trimmed"])) in calls
+        assert not any(method == "insert" for _, method, _ in calls)
+    
+    def test_save_profile_to_json_is_atomic(self, tmp_path, monkeypatch, sample_profile):
+        """Test JSON saves replace the file without leaving temp files behind."""
+        import memory.user_profile as user_profile
+        
+        monkeypatch.setattr(user_profile, "PROFILES_DIR", tmp_path)
+        get_preference_csvs(sample_profile)
+        
+        assert user_profile._save_profile_to_json("alice", sample_profile)
+        
+        assert [p.name for p in tmp_path.iterdir()] == ["alice.json"]
+        saved = json.loads((tmp_path / "alice.json").read_text())
+        assert saved["user_preferences"] == sample_profile["user_preferences"]
+        assert "_cached" not in saved
+        assert user_profile._load_profile_from_json("alice") == saved
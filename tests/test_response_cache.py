@@ -0,0 +1,154 @@
+"""
+Tests for the agent response cache.
+"""
+
+import asyncio
+import pytest
+from core.response_cache import SemanticResponseCache
+
+
+def make_embedder(vectors):
+    """Build a fake async embedder from a text -> vector mapping."""
+    async def embed(text):
+        return vectors[text]
+    return embed
+
+
+class TestSemanticResponseCache:
+    """Test response cache behaviour."""
+
+    async def test_exact_match_skips_compute(self):
+        """Test identical requests are served from the exact tier."""
+        cache = SemanticResponseCache(embed_fn=make_embedder({"a": [1.0, 0.0]}))
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return "response"
+
+        assert await cache.get_or_compute("a", compute) == "response"
+        assert await cache.get_or_compute("a", compute) == "response"
+
+        assert len(calls) == 1
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_semantic_match_within_threshold(self):
+        """Test reworded notes for the same request reuse the cached response."""
+        cache = SemanticResponseCache(
+            embed_fn=make_embedder({"a": [1.0, 0.0], "b": [0.99, 0.05]})
+        )
+
+        async def compute_a():
+            return "first"
+
+        async def compute_b():
+            return "second"
+
+        await cache.get_or_compute("goal", compute_a, notes="a")
+        assert await cache.get_or_compute("goal", compute_b, notes="b") == "first"
+        assert cache.get_stats()["semantic_hits"] == 1
+
+    async def test_semantic_match_requires_same_request(self):
+        """Test similar notes never match across different calories or restrictions."""
+        cache = SemanticResponseCache(
+            embed_fn=make_embedder({"a": [1.0, 0.0], "b": [0.99, 0.05]})
+        )
+
+        async def compute_1200():
+            return "1200"
+
+        async def compute_1250():
+            return "1250"
+
+        await cache.get_or_compute("1200 cal, no restrictions", compute_1200, notes="a")
+        assert await cache.get_or_compute(
+            "1250 cal, no restrictions", compute_1250, notes="b"
+        ) == "1250"
+        assert cache.get_stats()["semantic_hits"] == 0
+
+    async def test_requests_without_notes_skip_embedding(self):
+        """Test the embedder is only called for requests with notes."""
+        embedded = []
+
+        async def embed(text):
+            embedded.append(text)
+            return [1.0, 0.0]
+
+        cache = SemanticResponseCache(embed_fn=embed)
+
+        async def compute():
+            return "response"
+
+        await cache.get_or_compute("goal", compute)
+        cache.put("other goal", "streamed")
+
+        assert embedded == []
+
+    async def test_namespaces_are_isolated(self):
+        """Test responses are never shared across namespaces."""
+        cache = SemanticResponseCache(embed_fn=make_embedder({"a": [1.0, 0.0]}))
+
+        async def compute_one():
+            return "one"
+
+        async def compute_two():
+            return "two"
+
+        await cache.get_or_compute("a", compute_one, namespace="user-1")
+        assert await cache.get_or_compute("a", compute_two, namespace="user-2") == "two"
+
+    async def test_embedding_failure_falls_back_to_compute(self):
+        """Test embedding errors do not break request processing."""
+        async def broken_embed(text):
+            raise RuntimeError("embedding service down")
+
+        cache = SemanticResponseCache(embed_fn=broken_embed)
+
+        async def compute():
+            return "response"
+
+        assert await cache.get_or_compute("goal", compute, notes="a") == "response"
+        assert await cache.get_or_compute("goal", compute, notes="a") == "response"
+        assert cache.get_stats()["misses"] == 1
+
+    async def test_max_entries_evicts_oldest(self):
+        """Test the cache is bounded."""
+        cache = SemanticResponseCache(
+            max_entries=2,
+            embed_fn=make_embedder({"a": [1.0, 0.0, 0.0], "b": [0.0, 1.0, 0.0], "c": [0.0, 0.0, 1.0]}),
+        )
+
+        for text in ("a", "b", "c"):
+            async def compute(text=text):
+                return text
+            await cache.get_or_compute(text, compute)
+
+        assert cache.get_stats()["entries"] == 2
+
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        """Test concurrent misses for the same key share one computation."""
+        cache = SemanticResponseCache(embed_fn=make_embedder({"a": [1.0, 0.0]}))
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "response"
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("a", compute) for _ in range(5))
+        )
+
+        assert results == ["response"] * 5
+        assert len(calls) == 1
+        assert cache.get_stats()["coalesced"] == 4
+
+    async def test_put_then_get_exact(self):
+        """Test responses stored outside get_or_compute are served by get."""
+        cache = SemanticResponseCache(embed_fn=make_embedder({"a": [1.0, 0.0]}))
+
+        assert cache.get("a") is None
+        cache.put("a", "streamed", namespace="user-1")
+
+        assert cache.get("a", namespace="user-1") == "streamed"
+        assert cache.get("a", namespace="user-2") is None
@@ -0,0 +1,39 @@
+"""
+Tests for the retry handler.
+"""
+
+import pytest
+from core.retry_handler import RetryHandler
+
+
+class TestRetryHandler:
+    """Test retry delays and attempts."""
+    
+    def test_delays_grow_exponentially_up_to_cap(self):
+        """Test backoff doubles per attempt and stops at max_delay."""
+        handler = RetryHandler(max_retries=7, base_delay=1.0, max_delay=30.0, jitter=False)
+        
+        delays = [handler._calculate_delay(attempt) for attempt in range(7)]
+        
+        assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+    
+    def test_jitter_stays_within_half_to_full_delay(self):
+        """Test jittered delays stay between 50% and 100% of the backoff."""
+        handler = RetryHandler(max_retries=3, base_delay=2.0)
+        
+        for _ in range(20):
+            assert 2.0 <= handler._calculate_delay(1) <= 4.0
+    
+    def test_execute_retries_until_success(self):
+        """Test failing calls are retried and the eventual result returned."""
+        handler = RetryHandler(max_retries=2, base_delay=0.0, jitter=False)
+        calls = []
+        
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return "ok"
+        
+        assert handler.execute(flaky) == "ok"
+        assert len(calls) == 3
@@ -0,0 +1 @@
+"""Streamlit UI components shared by the application entry points."""
@@ -0,0 +1,340 @@
+"""
+Shared Sidebar for the Streamlit Applications.
+
+Renders profile management and meal-preference widgets and turns the
+user's selections into a meal request. Both the single-agent and the
+multi-agent apps use this module, so the option lists and cached helpers
+are built once per process instead of on every script rerun.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Final, List, Tuple
+
+import streamlit as st
+
+from memory.user_profile import (
+    create_default_profile,
+    get_preference_csvs,
+    get_profile_summary,
+    invalidate_profile_cache,
+    list_profiles,
+    load_profile,
+    save_profile,
+)
+
+# Popular chains offered in the restaurant picker
+DEFAULT_RESTAURANTS: Final[Tuple[str, ...]] = (
+    "Chick-fil-A",
+    "McDonald's",
+    "Subway",
+    "Taco Bell",
+    "Burger King",
+    "KFC",
+    "Pizza Hut",
+    "Domino's",
+)
+
+# Common dietary restrictions offered in the multiselect
+RESTRICTION_OPTIONS: Final[Tuple[str, ...]] = (
+    "No restrictions",
+    "Gluten-free",
+    "Dairy-free",
+    "Vegetarian",
+    "Vegan",
+    "No pork",
+    "No beef",
+    "Low sodium",
+    "Low carb",
+    "Keto",
+)
+RESTRICTION_OPTIONS_SET: Final[frozenset] = frozenset(RESTRICTION_OPTIONS)
+
+DEFAULT_CALORIES: Final[int] = 1200
+
+# Restrictions sentence used when none are selected
+_NO_RESTR: Final[str] = "I have no dietary restrictions"
+
+
+@dataclass(frozen=True)
+class MealRequest:
+    """User selections captured from the sidebar."""
+
+    restaurant: str
+    calories: int
+    dietary_restrictions: Tuple[str, ...]
+    additional_notes: str
+
+
+# Profile reads are served from Streamlit's cache until a save invalidates them
+_list_profiles = st.cache_data(show_spinner=False)(list_profiles)
+_load_profile = st.cache_data(show_spinner=False)(load_profile)
+
+
+def save_profile_and_refresh(profile_name: str, profile_data: Dict) -> bool:
+    """
+    Save a profile and invalidate the cached profile list and loads.
+
+    Args:
+        profile_name: Name of the profile
+        profile_data: Profile data to save
+
+    Returns:
+        True if successful, False otherwise
+    """
+    saved = save_profile(profile_name, profile_data)
+    if saved:
+        _list_profiles.clear()
+        _load_profile.clear()
+    return saved
+
+
+@st.cache_data(show_spinner=False)
+def _restaurant_options(fav_restaurants: tuple) -> List[str]:
+    """List favorite restaurants first, followed by the remaining defaults."""
+    fav_set = set(fav_restaurants)
+    return list(fav_restaurants) + [r for r in DEFAULT_RESTAURANTS if r not in fav_set]
+
+
+def _default_notes(profile: Dict) -> str:
+    """Build the default notes text from the profile's memoized preference lists."""
+    csvs = get_preference_csvs(profile)
+    notes_parts = []
+    if csvs["methods_csv"]:
+        notes_parts.append(f"Prefer {csvs['methods_csv']}")
+    if csvs["dislikes_csv"]:
+        notes_parts.append(f"Dislike {csvs['dislikes_csv']}")
+    return "; ".join(notes_parts)
+
+
+def format_user_goal(request: MealRequest) -> str:
+    """
+    Format a meal request into a natural language goal for the agents.
+
+    Args:
+        request: Sidebar selections to describe
+
+    Returns:
+        A formatted string representing the user's meal request.
+
+    Raises:
+        ValueError: If restaurant name is empty or invalid.
+    """
+    # Validate restaurant input
+    if not request.restaurant:
+        raise ValueError("Restaurant name cannot be empty")
+
+    # Lowercased and sorted so equivalent requests yield the same (cacheable) goal
+    return _format_user_goal_cached(
+        request.restaurant.lower(),
+        request.calories,
+        tuple(sorted(request.dietary_restrictions)),
+        request.additional_notes,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _format_user_goal_cached(
+    restaurant: str,
+    calories: int,
+    dietary_restrictions: Tuple[str, ...],
+    additional_notes: str,
+) -> str:
+    """
+    Build the user goal; memoized since the sidebar reruns with the same inputs.
+
+    Inputs are already normalized by the sidebar (stripped, restaurant
+    lowercased), so no string cleanup happens here.
+    """
+    # Format dietary restrictions into natural language
+    restrictions_text = (
+        f"I have dietary restrictions: {', '.join(dietary_restrictions)}"
+        if dietary_restrictions
+        else _NO_RESTR
+    )
+
+    # Build the main user goal
+    user_goal = f"I want a {calories} calorie meal from {restaurant}. {restrictions_text}."
+
+    # Add additional notes if provided
+    if additional_notes:
+        user_goal += f" Additional preferences: {additional_notes}."
+
+    return user_goal
+
+
+def _render_profile_management() -> None:
+    """Render profile selection/creation and update the session's profile."""
+    st.sidebar.header("👤 Profile Management")
+
+    available_profiles = _list_profiles()
+    profile_action = st.sidebar.radio(
+        "Profile Options:",
+        ["Use Existing Profile", "Create New Profile", "No Profile (Guest)"],
+    )
+
+    if profile_action == "Use Existing Profile":
+        if available_profiles:
+            selected_profile = st.sidebar.selectbox(
+                "Select Profile:", [""] + available_profiles
+            )
+
+            if selected_profile:
+                if (
+                    st.session_state.profile_name != selected_profile
+                    or st.session_state.current_profile is None
+                ):
+                    st.session_state.current_profile = _load_profile(selected_profile)
+                    st.session_state.profile_name = selected_profile
+
+                if st.session_state.current_profile:
+                    st.sidebar.success(f"✓ Loaded: {selected_profile}")
+                    with st.sidebar.expander("📊 Profile Stats"):
+                        st.markdown(get_profile_summary(st.session_state.current_profile))
+        else:
+            st.sidebar.info("No profiles found. Create one below!")
+
+    elif profile_action == "Create New Profile":
+        new_profile_name = st.sidebar.text_input(
+            "Profile Name:", placeholder="e.g., John, Work Diet, Keto Plan"
+        )
+
+        if st.sidebar.button("Create Profile"):
+            if new_profile_name:
+                new_profile = create_default_profile()
+                if save_profile_and_refresh(new_profile_name, new_profile):
+                    st.session_state.current_profile = new_profile
+                    st.session_state.profile_name = new_profile_name
+                    st.sidebar.success(f"✓ Created profile: {new_profile_name}")
+                    st.rerun()
+                else:
+                    st.sidebar.error("Failed to create profile")
+            else:
+                st.sidebar.warning("Please enter a profile name")
+
+    elif profile_action == "No Profile (Guest)":
+        st.session_state.current_profile = None
+        st.session_state.profile_name = None
+        st.sidebar.info("Using guest mode (no memory)")
+
+
+def _render_preferences(profile: Dict) -> MealRequest:
+    """Render the meal preference widgets, defaulting from the profile if any."""
+    st.sidebar.markdown("---")
+    st.sidebar.header("📋 Your Meal Preferences")
+
+    prefs = profile["user_preferences"] if profile else {}
+
+    # Restaurant selection with two options: preset list or custom input
+    restaurant_option = st.sidebar.radio(
+        "Restaurant:", ["Select from list", "Enter custom restaurant"]
+    )
+
+    if profile:
+        # Favorites first, followed by the remaining defaults
+        all_restaurants = _restaurant_options(
+            tuple(prefs.get("favorite_restaurants", []))
+        )
+    else:
+        all_restaurants = DEFAULT_RESTAURANTS
+
+    if restaurant_option == "Select from list":
+        restaurant = st.sidebar.selectbox("Choose a restaurant:", all_restaurants)
+    else:
+        restaurant = st.sidebar.text_input(
+            "Enter restaurant name:",
+            placeholder="e.g., Five Guys, Chipotle, Panera Bread...",
+        )
+
+    # Calorie target input with reasonable limits
+    calories = st.sidebar.number_input(
+        "Target calories:",
+        min_value=300,
+        max_value=2000,
+        value=prefs.get("default_calorie_target", DEFAULT_CALORIES),
+        step=50,
+    )
+
+    # Dietary restrictions selection with two input methods
+    restrictions_option = st.sidebar.radio(
+        "Dietary restrictions:", ["Select from list", "Enter custom restrictions"]
+    )
+
+    default_restrictions = prefs.get("dietary_restrictions", [])
+
+    if restrictions_option == "Select from list":
+        # Only preselect values that exist in the options (case-sensitive match)
+        valid_defaults = [r for r in default_restrictions if r in RESTRICTION_OPTIONS_SET]
+
+        dietary_restrictions = st.sidebar.multiselect(
+            "Choose restrictions (if any):",
+            RESTRICTION_OPTIONS,
+            default=valid_defaults,
+        )
+    else:
+        custom_restrictions = st.sidebar.text_input(
+            "Enter your dietary restrictions:",
+            value=", ".join(default_restrictions),
+            placeholder="e.g., no nuts, halal, kosher, diabetic-friendly...",
+        )
+        custom_restrictions = custom_restrictions.strip()
+        dietary_restrictions = [custom_restrictions] if custom_restrictions else []
+
+    # Additional preferences and notes input
+    additional_notes = st.sidebar.text_area(
+        "Additional preferences or notes:",
+        value=_default_notes(profile) if profile else "",
+        placeholder="e.g., prefer grilled over fried, need extra protein, avoid spicy foods, want to maximize fiber, etc.",
+        help="Be specific about your preferences. For example: 'I need extra protein for muscle building' or 'I prefer grilled options over fried'",
+    )
+
+    # Normalize once here so the formatter and its cache key see stable values
+    return MealRequest(
+        restaurant=(restaurant or "").strip(),
+        calories=int(calories),
+        dietary_restrictions=tuple(dietary_restrictions),
+        additional_notes=additional_notes.strip(),
+    )
+
+
+def _save_preferences(profile: Dict, request: MealRequest) -> None:
+    """Store the current selections as the profile's defaults and save it."""
+    prefs = profile["user_preferences"]
+    prefs["default_calorie_target"] = request.calories
+    prefs["dietary_restrictions"] = list(request.dietary_restrictions)
+
+    # Add restaurant to favorites if not already there
+    if request.restaurant and request.restaurant not in prefs["favorite_restaurants"]:
+        prefs["favorite_restaurants"].append(request.restaurant)
+
+    invalidate_profile_cache(profile)
+
+    if save_profile_and_refresh(st.session_state.profile_name, profile):
+        st.sidebar.success("✓ Preferences saved!")
+    else:
+        st.sidebar.error("Failed to save preferences")
+
+
+def render_sidebar() -> MealRequest:
+    """
+    Render the profile and preference sidebar.
+
+    Initializes the profile entries in session state, lets the user pick or
+    create a profile, and offers to save the current selections to it.
+
+    Returns:
+        The meal request described by the sidebar widgets
+    """
+    if "current_profile" not in st.session_state:
+        st.session_state.current_profile = None
+    if "profile_name" not in st.session_state:
+        st.session_state.profile_name = None
+
+    _render_profile_management()
+
+    profile = st.session_state.current_profile
+    request = _render_preferences(profile)
+
+    if profile and st.sidebar.button("💾 Save Current Preferences to Profile"):
+        _save_preferences(profile, request)
+
+    return request